@@ -21,6 +21,7 @@ class Settings(BaseSettings):
         supabase_url: Supabase project URL
         supabase_anon_key: Supabase anonymous (public) API key
         supabase_service_role_key: Supabase service role (private) API key
+        database_url: Optional direct PostgreSQL connection URL used for COPY bulk loads
         environment: Application environment (development, production, test)
         api_key: Internal API key for protected endpoints
         log_level: Logging level
@@ -29,7 +30,10 @@ class Settings(BaseSettings):
         mevo_station_info_url: MEVO station information endpoint
         mevo_station_status_url: MEVO station status endpoint
         api_request_timeout: Timeout for external API requests in seconds
+        api_request_attempts: Maximum attempts per external API request (including retries)
+        mevo_requests_per_second: Client-side rate limit for MEVO API requests
         sync_interval_minutes: Background sync interval in minutes
+        snapshot_batch_size: Maximum availability snapshots per insert request
         reliability_calculation_hour: Hour of day to calculate reliability scores
     """
     
@@ -37,6 +41,10 @@ class Settings(BaseSettings):
     supabase_url: str = Field(..., description="Supabase project URL")
     supabase_anon_key: str = Field(..., description="Supabase anonymous API key")
     supabase_service_role_key: str = Field(..., description="Supabase service role API key")
+    database_url: Optional[str] = Field(
+        default=None,
+        description="Direct PostgreSQL connection URL; enables COPY-based bulk inserts"
+    )
     
     # Application Configuration
     environment: str = Field(default="development", description="Application environment")
@@ -61,9 +69,24 @@ class Settings(BaseSettings):
         description="MEVO station status (real-time availability) endpoint"
     )
     api_request_timeout: int = Field(default=30, description="API request timeout in seconds")
+    api_request_attempts: int = Field(
+        default=3,
+        ge=1,
+        description="Maximum attempts per API request; network errors and 5xx responses are retried"
+    )
+    mevo_requests_per_second: float = Field(
+        default=10,
+        gt=0,
+        description="Maximum MEVO API requests per second issued by the data seeder"
+    )
     
     # Background Task Configuration
     sync_interval_minutes: int = Field(default=5, description="Sync interval in minutes")
+    snapshot_batch_size: int = Field(
+        default=500,
+        ge=1,
+        description="Maximum availability snapshots sent in one insert request"
+    )
     reliability_calculation_hour: int = Field(
         default=2, 
         description="Hour of day to calculate reliability scores (0-23)"
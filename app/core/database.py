@@ -5,8 +5,11 @@ This module provides a centralized way to connect to Supabase and manage
 database operations throughout the application.
 """
 
+import asyncio
 import logging
 from typing import Optional
+
+import asyncpg
 from supabase import create_client, Client
 from app.core.config import settings
 
@@ -27,6 +30,8 @@ class SupabaseClient:
     def __init__(self):
         """Initialize the Supabase client with configuration settings."""
         self._client: Optional[Client] = None
+        self._pool: Optional[asyncpg.Pool] = None
+        self._pool_lock = asyncio.Lock()
         
     @property
     def client(self) -> Client:
@@ -56,6 +61,48 @@ class SupabaseClient:
         
         return self._client
     
+    async def get_pool(self) -> Optional[asyncpg.Pool]:
+        """
+        Get the direct PostgreSQL connection pool used for bulk COPY loads.
+        
+        The pool is created on first use, and only when DATABASE_URL is
+        configured. Without it, all writes go through the Supabase client.
+        
+        Returns:
+            Optional[asyncpg.Pool]: Connection pool, or None if not configured
+            
+        Raises:
+            Exception: If pool creation fails
+        """
+        if not settings.database_url:
+            return None
+        
+        async with self._pool_lock:
+            if self._pool is None:
+                try:
+                    logger.info("Creating PostgreSQL connection pool")
+                    self._pool = await asyncpg.create_pool(
+                        dsn=settings.database_url,
+                        min_size=2,
+                        max_size=10,
+                        # Supabase's pooler runs in transaction mode, which
+                        # does not support server-side prepared statements
+                        statement_cache_size=0
+                    )
+                    logger.info("PostgreSQL connection pool created successfully")
+                except Exception as e:
+                    logger.error(f"Failed to create PostgreSQL connection pool: {str(e)}")
+                    raise Exception(f"Database connection failed: {str(e)}")
+        
+        return self._pool
+    
+    async def close_pool(self) -> None:
+        """Close the direct PostgreSQL connection pool if it was opened."""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+            logger.info("PostgreSQL connection pool closed")
+    
     async def test_connection(self) -> bool:
         """
         Test the Supabase connection.
@@ -18,6 +18,7 @@ from app.core.config import settings
 from app.core.database import db
 from app.routers import stations, internal
 from app.services.background_scheduler import start_background_tasks, stop_background_tasks
+from app.services.mevo_api_client import close_shared_mevo_client
 
 
 # Configure logging
@@ -74,6 +75,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.info("Background tasks stopped successfully")
     except Exception as e:
         logger.error(f"Failed to stop background tasks: {str(e)}")
+    
+    # Close pooled MEVO API connections
+    try:
+        await close_shared_mevo_client()
+    except Exception as e:
+        logger.error(f"Failed to close MEVO API client: {str(e)}")
+    
+    # Close the direct database pool used for bulk loads
+    try:
+        await db.close_pool()
+    except Exception as e:
+        logger.error(f"Failed to close database pool: {str(e)}")
 
 
 def create_application() -> FastAPI:
@@ -147,10 +160,10 @@ async def health_check():
             "version": "1.0.0",
             "environment": "development",
             "database": "connected",
-            "timestamp": "2024-01-15T10:30:00Z"
+            "timestamp": "2024-01-15T10:30:00+00:00"
         }
     """
-    from datetime import datetime
+    from datetime import datetime, timezone
     
     # Test database connection
     database_status = "connected"
@@ -170,7 +183,7 @@ async def health_check():
                 "status": "unhealthy",
                 "message": "Database connection failed",
                 "database": database_status,
-                "timestamp": datetime.utcnow().isoformat() + "Z"
+                "timestamp": datetime.now(timezone.utc).isoformat()
             }
         )
     
@@ -180,7 +193,7 @@ async def health_check():
         "version": "1.0.0",
         "environment": settings.environment,
         "database": database_status,
-        "timestamp": datetime.utcnow().isoformat() + "Z"
+        "timestamp": datetime.now(timezone.utc).isoformat()
     }
 
 
@@ -5,11 +5,16 @@ This module handles all database operations related to bike stations,
 providing a clean interface between the business logic and Supabase.
 """
 
+import asyncio
 import logging
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date
 from decimal import Decimal
 
+import httpx
+import orjson
+from postgrest.types import ReturnMethod
+
 from app.core.database import SupabaseClient
 from app.schemas.station import (
     BikeStation,
@@ -25,6 +30,32 @@ from app.schemas.station import (
 
 logger = logging.getLogger(__name__)
 
+# Columns written by copy_stations, in row-tuple order
+STATION_COPY_COLUMNS = (
+    'external_station_id',
+    'name',
+    'address',
+    'latitude',
+    'longitude',
+    'total_docks',
+    'is_active',
+    'content_hash',
+    'geohash6',
+)
+
+# Column order of the row tuples passed to copy_availability_snapshots
+SNAPSHOT_COPY_COLUMNS = (
+    'station_id',
+    'available_bikes',
+    'available_docks',
+    'is_renting',
+    'is_returning',
+    'timestamp',
+    'day_of_week',
+    'hour',
+    'minute_slot',
+)
+
 
 class StationRepository:
     """
@@ -43,6 +74,42 @@ class StationRepository:
         """
         self.db = db
     
+    def _post_rows(
+        self,
+        table: str,
+        rows: List[Dict[str, Any]],
+        prefer: str,
+        params: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        """
+        Send rows to a PostgREST table endpoint as one pre-serialized body.
+        
+        Bulk writes bypass the query builder so the body is encoded once with
+        orjson instead of the stdlib JSON encoder. The call is synchronous,
+        like the Supabase client it reuses the session of.
+        
+        Args:
+            table: Target table name
+            rows: Rows to write; datetimes are serialized as ISO strings
+            prefer: PostgREST Prefer header (return and resolution options)
+            params: Optional query parameters, e.g. on_conflict
+            
+        Returns:
+            httpx.Response: Successful PostgREST response
+            
+        Raises:
+            Exception: If PostgREST returns an error status
+        """
+        response = self.db.client.postgrest.session.post(
+            f"/{table}",
+            content=orjson.dumps(rows),
+            params=params,
+            headers={'Content-Type': 'application/json', 'Prefer': prefer}
+        )
+        if response.is_error:
+            raise Exception(f"PostgREST error {response.status_code}: {response.text}")
+        return response
+    
     # =====================================================
     # BIKE STATION OPERATIONS
     # =====================================================
@@ -164,11 +231,7 @@ class StationRepository:
         try:
             logger.info(f"Creating new station: {station_data.name}")
             
-            # Convert to dict with proper JSON serialization
             station_dict = station_data.model_dump()
-            # Convert Decimal to float for JSON serialization
-            station_dict['latitude'] = float(station_dict['latitude'])
-            station_dict['longitude'] = float(station_dict['longitude'])
             
             result = self.db.client.table('bike_stations').insert(station_dict).execute()
             
@@ -196,14 +259,7 @@ class StationRepository:
         try:
             logger.info(f"Creating {len(stations_data)} stations in batch")
             
-            # Convert to dicts for Supabase with proper JSON serialization
-            insert_data = []
-            for station in stations_data:
-                station_dict = station.model_dump()
-                # Convert Decimal to float for JSON serialization
-                station_dict['latitude'] = float(station_dict['latitude'])
-                station_dict['longitude'] = float(station_dict['longitude'])
-                insert_data.append(station_dict)
+            insert_data = [station.model_dump() for station in stations_data]
             
             result = self.db.client.table('bike_stations').insert(insert_data).execute()
             
@@ -218,6 +274,96 @@ class StationRepository:
             logger.error(f"Failed to create stations batch: {str(e)}")
             raise Exception(f"Database error: {str(e)}")
     
+    async def upsert_stations_batch(self, stations_data: List[BikeStationCreate]) -> List[BikeStation]:
+        """
+        Insert or update multiple bike stations in a single request.
+        
+        Rows are matched on external_station_id: existing stations are
+        updated in place and unknown ones are inserted.
+        
+        Args:
+            stations_data: List of station data to insert or update
+            
+        Returns:
+            List[BikeStation]: Stations as stored after the upsert
+        """
+        try:
+            logger.info(f"Upserting {len(stations_data)} stations in batch")
+            
+            upsert_data = [station.model_dump() for station in stations_data]
+            
+            # Sent from a worker thread so concurrent chunks overlap instead of
+            # blocking the event loop on the synchronous Supabase session
+            response = await asyncio.to_thread(
+                self._post_rows,
+                'bike_stations',
+                upsert_data,
+                prefer='resolution=merge-duplicates,return=representation',
+                params={'on_conflict': 'external_station_id'}
+            )
+            
+            upserted_stations = [BikeStation(**station) for station in orjson.loads(response.content)]
+            logger.info(f"Upserted {len(upserted_stations)} stations in batch")
+            return upserted_stations
+            
+        except Exception as e:
+            logger.error(f"Failed to upsert stations batch: {str(e)}")
+            raise Exception(f"Database error: {str(e)}")
+    
+    async def copy_stations(self, stations_data: List[BikeStationCreate]) -> int:
+        """
+        Bulk-load new bike stations with PostgreSQL COPY.
+        
+        Intended for the first seed into an empty table: unlike the upsert,
+        COPY does not resolve conflicts, so any existing external_station_id
+        makes the whole load fail.
+        
+        Args:
+            stations_data: List of station data to create
+            
+        Returns:
+            int: Number of stations created
+            
+        Raises:
+            Exception: If no direct connection is configured or the COPY fails
+        """
+        try:
+            pool = await self.db.get_pool()
+            if pool is None:
+                raise Exception("Direct database connection is not configured")
+            
+            records = [
+                (
+                    station.external_station_id,
+                    station.name,
+                    station.address,
+                    # NUMERIC columns take Decimal; str() keeps the shortest float repr
+                    Decimal(str(station.latitude)),
+                    Decimal(str(station.longitude)),
+                    station.total_docks,
+                    station.is_active,
+                    station.content_hash,
+                    station.geohash6
+                )
+                for station in stations_data
+            ]
+            
+            logger.info(f"Copying {len(records)} stations")
+            
+            async with pool.acquire() as conn:
+                await conn.copy_records_to_table(
+                    'bike_stations',
+                    records=records,
+                    columns=STATION_COPY_COLUMNS
+                )
+            
+            logger.info(f"Copied {len(records)} stations")
+            return len(records)
+            
+        except Exception as e:
+            logger.error(f"Failed to copy stations: {str(e)}")
+            raise Exception(f"Database error: {str(e)}")
+    
     async def update_station(self, station_id: int, station_data: BikeStationUpdate) -> Optional[BikeStation]:
         """
         Update an existing bike station.
@@ -258,6 +404,21 @@ class StationRepository:
             logger.error(f"Failed to update station {station_id}: {str(e)}")
             raise Exception(f"Database error: {str(e)}")
     
+    async def get_station_counts_by_area(self) -> List[Dict[str, Any]]:
+        """
+        Get station counts per service area, aggregated in the database.
+        
+        Returns:
+            List[Dict]: Rows with area, station_count and active_count
+        """
+        try:
+            result = self.db.client.rpc('station_counts_by_area', {}).execute()
+            return result.data or []
+            
+        except Exception as e:
+            logger.error(f"Failed to get station counts by area: {str(e)}")
+            raise Exception(f"Database error: {str(e)}")
+    
     # =====================================================
     # NEARBY STATIONS (SPATIAL QUERIES)
     # =====================================================
@@ -337,39 +498,94 @@ class StationRepository:
             logger.error(f"Failed to create availability snapshot: {str(e)}")
             raise Exception(f"Database error: {str(e)}")
     
-    async def create_availability_snapshots_batch(self, snapshots_data: List[AvailabilitySnapshotCreate]) -> List[AvailabilitySnapshot]:
+    async def create_availability_snapshots_batch(self, snapshots_data: List[AvailabilitySnapshotCreate]) -> int:
         """
-        Create multiple availability snapshots in a batch operation.
+        Create multiple availability snapshots in a single insert statement.
+        
+        Validated-model wrapper around create_availability_snapshots_raw.
+        The insert is atomic: either every row is written or an error is raised.
         
         Args:
             snapshots_data: List of snapshot data to create
             
         Returns:
-            List[AvailabilitySnapshot]: List of created snapshots
+            int: Number of snapshots created
+        """
+        return await self.create_availability_snapshots_raw(
+            [snapshot.model_dump(mode='json') for snapshot in snapshots_data]
+        )
+    
+    async def create_availability_snapshots_raw(self, snapshots_data: List[Dict[str, Any]]) -> int:
+        """
+        Create multiple availability snapshots from pre-built rows.
+        
+        Internal fast path for the sync job: rows are sent as given, without
+        per-row Pydantic validation, so callers must pass JSON-ready dicts
+        (timestamps as ISO strings) matching the table columns.
+        
+        Args:
+            snapshots_data: Snapshot rows to insert
+            
+        Returns:
+            int: Number of snapshots created
         """
         try:
             logger.info(f"Creating {len(snapshots_data)} availability snapshots in batch")
             
-            # Convert to dicts for Supabase with proper JSON serialization
-            insert_data = []
-            for snapshot in snapshots_data:
-                snapshot_dict = snapshot.model_dump()
-                # Convert datetime to ISO string for JSON serialization
-                if 'timestamp' in snapshot_dict and snapshot_dict['timestamp']:
-                    snapshot_dict['timestamp'] = snapshot_dict['timestamp'].isoformat()
-                insert_data.append(snapshot_dict)
+            # The Supabase session is synchronous; serialize and send in a
+            # worker thread so concurrent batches don't block the event loop
+            await asyncio.to_thread(
+                self._post_rows, 'availability_snapshots', snapshots_data, 'return=minimal'
+            )
             
-            result = self.db.client.table('availability_snapshots').insert(insert_data).execute()
+            logger.info(f"Created {len(snapshots_data)} snapshots in batch")
+            return len(snapshots_data)
             
-            if result.data:
-                created_snapshots = [AvailabilitySnapshot(**snapshot) for snapshot in result.data]
-                logger.info(f"Created {len(created_snapshots)} snapshots in batch")
-                return created_snapshots
+        except Exception as e:
+            logger.error(f"Failed to create snapshots batch: {str(e)}")
+            raise Exception(f"Database error: {str(e)}")
+    
+    async def supports_copy(self) -> bool:
+        """
+        Check whether bulk loads can use PostgreSQL COPY.
+        
+        Returns:
+            bool: True if a direct database connection is configured
+        """
+        return await self.db.get_pool() is not None
+    
+    async def copy_availability_snapshots(self, records: List[tuple]) -> int:
+        """
+        Bulk-load availability snapshots with PostgreSQL COPY.
+        
+        Args:
+            records: Row tuples ordered as SNAPSHOT_COPY_COLUMNS
+            
+        Returns:
+            int: Number of snapshots created
             
-            raise Exception("Failed to create snapshots - no data returned")
+        Raises:
+            Exception: If no direct connection is configured or the COPY fails
+        """
+        try:
+            pool = await self.db.get_pool()
+            if pool is None:
+                raise Exception("Direct database connection is not configured")
+            
+            logger.info(f"Copying {len(records)} availability snapshots")
+            
+            async with pool.acquire() as conn:
+                await conn.copy_records_to_table(
+                    'availability_snapshots',
+                    records=records,
+                    columns=SNAPSHOT_COPY_COLUMNS
+                )
+            
+            logger.info(f"Copied {len(records)} snapshots")
+            return len(records)
             
         except Exception as e:
-            logger.error(f"Failed to create snapshots batch: {str(e)}")
+            logger.error(f"Failed to copy availability snapshots: {str(e)}")
             raise Exception(f"Database error: {str(e)}")
     
     async def get_recent_snapshots(self, station_id: int, limit: int = 10) -> List[AvailabilitySnapshot]:
@@ -670,6 +886,28 @@ class StationRepository:
             logger.error(f"Failed to create sync log: {str(e)}")
             raise Exception(f"Database error: {str(e)}")
     
+    async def create_sync_log_raw(self, log_data: Dict[str, Any]) -> None:
+        """
+        Create a new API sync log entry from a pre-built row.
+        
+        Internal fast path for the seeder: the row is inserted as given,
+        without Pydantic validation or echoing the created row back, so
+        callers must pass a JSON-ready dict (timestamps as ISO strings).
+        
+        Args:
+            log_data: Sync log row to insert
+        """
+        try:
+            (
+                self.db.client.table('api_sync_logs')
+                .insert(log_data, returning=ReturnMethod.minimal)
+                .execute()
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to create sync log: {str(e)}")
+            raise Exception(f"Database error: {str(e)}")
+    
     async def get_recent_sync_logs(self, limit: int = 10) -> List[ApiSyncLog]:
         """
         Get recent API sync logs.
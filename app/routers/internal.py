@@ -7,8 +7,9 @@ These endpoints require API key authentication.
 """
 
 import logging
+import time
 from typing import List, Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 from fastapi import APIRouter, Depends, HTTPException, status, Header
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
@@ -100,7 +101,8 @@ async def trigger_station_sync(
         POST /api/internal/sync/stations
         Authorization: Bearer your_api_key
     """
-    start_time = datetime.utcnow()
+    start_time = datetime.now(timezone.utc)
+    t0 = time.monotonic_ns()
     sync_log_data = ApiSyncLogCreate(
         sync_timestamp=start_time,
         sync_status=SyncStatus.SUCCESS,
@@ -128,8 +130,7 @@ async def trigger_station_sync(
         sync_log_data.stations_updated = stations_updated
         sync_log_data.sync_status = SyncStatus.SUCCESS
         
-        end_time = datetime.utcnow()
-        response_time_ms = int((end_time - start_time).total_seconds() * 1000)
+        response_time_ms = (time.monotonic_ns() - t0) // 1_000_000
         sync_log_data.response_time_ms = response_time_ms
         
         # Create sync log entry
@@ -193,7 +194,8 @@ async def trigger_availability_sync(
         POST /api/internal/sync/availability
         Authorization: Bearer your_api_key
     """
-    start_time = datetime.utcnow()
+    start_time = datetime.now(timezone.utc)
+    t0 = time.monotonic_ns()
     sync_log_data = ApiSyncLogCreate(
         sync_timestamp=start_time,
         sync_status=SyncStatus.SUCCESS,
@@ -220,8 +222,7 @@ async def trigger_availability_sync(
         sync_log_data.snapshots_created = snapshots_created
         sync_log_data.sync_status = SyncStatus.SUCCESS
         
-        end_time = datetime.utcnow()
-        response_time_ms = int((end_time - start_time).total_seconds() * 1000)
+        response_time_ms = (time.monotonic_ns() - t0) // 1_000_000
         sync_log_data.response_time_ms = response_time_ms
         
         # Create sync log entry
@@ -287,7 +288,8 @@ async def trigger_reliability_calculation(
         POST /api/internal/calculate/reliability?days_back=30
         Authorization: Bearer your_api_key
     """
-    start_time = datetime.utcnow()
+    start_time = datetime.now(timezone.utc)
+    t0 = time.monotonic_ns()
     
     try:
         logger.info(f"Starting reliability calculation (station_id={station_id}, days_back={days_back})")
@@ -319,8 +321,7 @@ async def trigger_reliability_calculation(
         
         scores_calculated = calculation_result['scores_calculated']
         
-        end_time = datetime.utcnow()
-        response_time_ms = int((end_time - start_time).total_seconds() * 1000)
+        response_time_ms = (time.monotonic_ns() - t0) // 1_000_000
         
         result = {
             "status": "success",
@@ -425,7 +426,7 @@ async def get_sync_health(
                 }
                 for log in recent_logs
             ],
-            "check_timestamp": datetime.utcnow().isoformat()
+            "check_timestamp": datetime.now(timezone.utc).isoformat()
         }
         
         logger.info(f"Sync health check completed: {health_status['overall_status']}")
@@ -471,7 +472,7 @@ async def get_scheduler_status(
                 "sync_interval_minutes": settings.sync_interval_minutes,
                 "reliability_calculation_hour": settings.reliability_calculation_hour
             },
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
         
     except Exception as e:
@@ -5,7 +5,7 @@ This module contains all data models for bike stations, including
 request/response schemas and internal data transfer objects.
 """
 
-from datetime import datetime, date
+from datetime import datetime, date, timezone
 from typing import Optional, List
 from decimal import Decimal
 from pydantic import BaseModel, Field, ConfigDict
@@ -41,8 +41,11 @@ class BikeStationBase(BaseModel):
 
 
 class BikeStationCreate(BikeStationBase):
-    """Schema for creating a new bike station."""
-    pass
+    """Schema for creating a new bike station (coordinates passed through as floats)."""
+    latitude: float = Field(..., ge=-90, le=90, description="Station latitude coordinate")
+    longitude: float = Field(..., ge=-180, le=180, description="Station longitude coordinate")
+    content_hash: Optional[int] = Field(None, description="Hash of the source station fields, used to skip unchanged rows")
+    geohash6: Optional[str] = Field(None, max_length=6, description="Level-6 geohash of the station location")
 
 
 class BikeStationUpdate(BaseModel):
@@ -60,6 +63,8 @@ class BikeStation(BikeStationBase):
     id: int = Field(..., description="Unique station identifier")
     created_at: datetime = Field(..., description="Station creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
+    content_hash: Optional[int] = Field(None, description="Hash of the source station fields")
+    geohash6: Optional[str] = Field(None, description="Level-6 geohash of the station location")
     
     model_config = ConfigDict(from_attributes=True)
 
@@ -222,7 +227,7 @@ class ErrorResponse(BaseModel):
     error: str = Field(..., description="Error type")
     message: str = Field(..., description="Human-readable error message")
     details: Optional[dict] = Field(None, description="Additional error details")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Error timestamp")
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="Error timestamp")
 
 
 class ValidationErrorResponse(ErrorResponse):
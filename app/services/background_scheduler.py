@@ -7,8 +7,9 @@ It handles station status collection, reliability calculation, and data maintena
 
 import logging
 import asyncio
+import time
 from typing import Optional
-from datetime import datetime, time
+from datetime import datetime, timezone
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.cron import CronTrigger
@@ -53,12 +54,16 @@ class BackgroundScheduler:
         self.scheduler = AsyncIOScheduler()
         
         # Add data collection task (every 5 minutes)
+        # Jobs are registered by textual reference to module-level coroutines so
+        # APScheduler never has to hold (or pickle) a bound method of this instance
         self.scheduler.add_job(
-            func=self._collect_station_status,
+            func='app.services.background_scheduler:run_collect_station_status',
             trigger=IntervalTrigger(minutes=settings.sync_interval_minutes),
             id='station_status_collection',
             name='Collect Station Status Data',
             max_instances=1,  # Prevent overlapping executions
+            coalesce=True,  # Collapse missed runs into a single execution
+            misfire_grace_time=60,
             replace_existing=True
         )
         
@@ -67,11 +72,13 @@ class BackgroundScheduler:
         
         # Add data maintenance task (weekly on Sunday at 3 AM)
         self.scheduler.add_job(
-            func=self._perform_data_maintenance,
+            func='app.services.background_scheduler:run_data_maintenance',
             trigger=CronTrigger(day_of_week='sun', hour=3, minute=0),
             id='data_maintenance',
             name='Weekly Data Maintenance',
             max_instances=1,
+            coalesce=True,
+            misfire_grace_time=3600,
             replace_existing=True
         )
         
@@ -174,7 +181,7 @@ class BackgroundScheduler:
                 'success': True,
                 'job_id': job_id,
                 'job_name': job.name,
-                'execution_time': datetime.utcnow().isoformat(),
+                'execution_time': datetime.now(timezone.utc).isoformat(),
                 'result': result
             }
             
@@ -184,7 +191,7 @@ class BackgroundScheduler:
                 'success': False,
                 'job_id': job_id,
                 'job_name': job.name,
-                'execution_time': datetime.utcnow().isoformat(),
+                'execution_time': datetime.now(timezone.utc).isoformat(),
                 'error': str(e)
             }
     
@@ -205,10 +212,15 @@ class BackgroundScheduler:
         try:
             logger.info("Starting scheduled station status collection")
             
+            t0 = time.monotonic_ns()
             result = await self.seeder.sync_station_status()
+            elapsed_ms = (time.monotonic_ns() - t0) / 1e6
             
             if result['success']:
-                logger.info(f"Status collection completed: {result['snapshots_created']} snapshots created")
+                logger.info(
+                    f"Status collection completed in {elapsed_ms:.0f} ms: "
+                    f"{result['snapshots_created']} snapshots created"
+                )
                 
                 # Schedule hourly averages update in background (non-blocking)
                 asyncio.create_task(self._update_hourly_averages_async())
@@ -397,6 +409,26 @@ class BackgroundScheduler:
 scheduler_instance = BackgroundScheduler()
 
 
+async def run_collect_station_status() -> dict:
+    """
+    Scheduled entry point for station status collection.
+    
+    Returns:
+        dict: Collection results
+    """
+    return await scheduler_instance._collect_station_status()
+
+
+async def run_data_maintenance() -> dict:
+    """
+    Scheduled entry point for weekly data maintenance.
+    
+    Returns:
+        dict: Maintenance results
+    """
+    return await scheduler_instance._perform_data_maintenance()
+
+
 async def start_background_tasks() -> None:
     """
     Start the global background task scheduler.
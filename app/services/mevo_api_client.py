@@ -21,15 +21,32 @@ System Details:
 
 import logging
 import asyncio
-from typing import Dict, List, Optional, Any
+import time
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timezone
 import httpx
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from tenacity import (
+    before_sleep_log,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# GBFS endpoints are fixed for the lifetime of the process
+_SYSTEM_INFO_URL = settings.mevo_system_info_url
+_STATION_INFO_URL = settings.mevo_station_info_url
+_STATION_STATUS_URL = settings.mevo_station_status_url
+
+# How long the station_id -> station index used by get_station_by_id stays valid
+_STATION_INDEX_TTL_SECONDS = 3600
+
 
 class MevoSystemInfo(BaseModel):
     """MEVO system information model."""
@@ -68,11 +85,35 @@ class MevoStationStatus(BaseModel):
     last_reported: int  # Unix timestamp
 
 
+# List validators are built once at import; validating a whole feed list in
+# one call runs in pydantic-core instead of N Python-level constructor calls
+_STATIONS_ADAPTER = TypeAdapter(List[MevoStation])
+_STATUSES_ADAPTER = TypeAdapter(List[MevoStationStatus])
+
+
 class MevoApiError(Exception):
     """Custom exception for MEVO API errors."""
     pass
 
 
+def _is_retryable_error(exc: BaseException) -> bool:
+    """
+    Decide whether a failed MEVO request is worth retrying.
+    
+    Network errors and 5xx responses are usually transient; 4xx responses
+    will not change on retry.
+    
+    Args:
+        exc: Exception raised by the request
+        
+    Returns:
+        bool: True if the request should be retried
+    """
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500
+    return isinstance(exc, httpx.RequestError)
+
+
 class MevoApiClient:
     """
     Asynchronous client for MEVO Gdańsk bike sharing GBFS API.
@@ -81,31 +122,81 @@ class MevoApiClient:
     including system information, station data, and real-time status.
     """
     
-    def __init__(self):
-        """Initialize the MEVO API client."""
+    def __init__(
+        self,
+        limits: Optional[httpx.Limits] = None,
+        client: Optional[httpx.AsyncClient] = None
+    ):
+        """
+        Initialize the MEVO API client.
+        
+        Args:
+            limits: Optional connection pool limits for the HTTP session;
+                httpx defaults are used when omitted
+            client: Optional pre-configured HTTP session to use (e.g. with
+                HTTP/2 enabled); it is closed together with this client
+        """
         self.timeout = httpx.Timeout(settings.api_request_timeout)
-        self.base_urls = {
-            'discovery': settings.mevo_gbfs_discovery_url,
-            'system_info': settings.mevo_system_info_url,
-            'station_info': settings.mevo_station_info_url,
-            'station_status': settings.mevo_station_status_url,
-        }
-        self._session: Optional[httpx.AsyncClient] = None
+        self.limits = limits
+        self._session: Optional[httpx.AsyncClient] = client
+        self._station_index: Dict[str, MevoStation] = {}
+        self._station_index_expires = 0.0
+        # url -> (expiry on the monotonic clock, parsed GBFS payload)
+        self._response_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
     
     async def __aenter__(self):
         """Async context manager entry."""
-        self._session = httpx.AsyncClient(timeout=self.timeout)
+        if self._session is None:
+            if self.limits is not None:
+                self._session = httpx.AsyncClient(timeout=self.timeout, limits=self.limits)
+            else:
+                # Keep httpx's default pool limits
+                self._session = httpx.AsyncClient(timeout=self.timeout)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
         if self._session:
             await self._session.aclose()
+            self._session = None
+    
+    @retry(
+        stop=stop_after_attempt(settings.api_request_attempts),
+        wait=wait_exponential_jitter(initial=0.5, max=5),
+        retry=retry_if_exception(_is_retryable_error),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True
+    )
+    async def _get_with_retry(self, url: str) -> httpx.Response:
+        """
+        GET a URL, retrying transient failures with jittered exponential backoff.
+        
+        Args:
+            url: The URL to request
+            
+        Returns:
+            httpx.Response: Successful response
+            
+        Raises:
+            httpx.HTTPStatusError: If the final attempt returns an error status
+            httpx.RequestError: If the final attempt fails at the network level
+        """
+        response = await self._session.get(url)
+        response.raise_for_status()
+        return response
     
     async def _make_request(self, url: str) -> Dict[str, Any]:
         """
         Make an HTTP request to the MEVO API.
         
+        Responses are cached per URL for the feed's GBFS ``ttl`` (in seconds),
+        so repeated calls within that window reuse the last payload instead
+        of downloading and parsing it again.
+        
         Args:
             url: The URL to request
             
@@ -118,17 +209,25 @@ class MevoApiClient:
         if not self._session:
             raise MevoApiError("Client session not initialized. Use async context manager.")
         
+        cached = self._response_cache.get(url)
+        if cached is not None and time.monotonic() < cached[0]:
+            logger.debug(f"Using cached MEVO API response for {url}")
+            return cached[1]
+        
         try:
             logger.info(f"Making request to MEVO API: {url}")
-            response = await self._session.get(url)
-            response.raise_for_status()
+            response = await self._get_with_retry(url)
             
-            data = response.json()
+            data = orjson.loads(response.content)
             
             # Validate GBFS response structure
             if 'data' not in data:
                 raise MevoApiError(f"Invalid GBFS response structure from {url}")
             
+            ttl = data.get('ttl')
+            if isinstance(ttl, (int, float)) and ttl > 0:
+                self._response_cache[url] = (time.monotonic() + ttl, data)
+            
             logger.info(f"Successfully fetched data from {url}")
             return data
             
@@ -152,7 +251,7 @@ class MevoApiClient:
             MevoSystemInfo: System details including operator, timezone, etc.
         """
         try:
-            response = await self._make_request(self.base_urls['system_info'])
+            response = await self._make_request(_SYSTEM_INFO_URL)
             system_data = response['data']
             
             return MevoSystemInfo(**system_data)
@@ -169,17 +268,21 @@ class MevoApiClient:
             List[MevoStation]: List of all stations with locations and details
         """
         try:
-            response = await self._make_request(self.base_urls['station_info'])
+            response = await self._make_request(_STATION_INFO_URL)
             stations_data = response['data']['stations']
             
-            stations = []
-            for station_data in stations_data:
-                try:
-                    station = MevoStation(**station_data)
-                    stations.append(station)
-                except Exception as e:
-                    logger.warning(f"Failed to parse station {station_data.get('station_id', 'unknown')}: {str(e)}")
-                    continue
+            try:
+                stations = _STATIONS_ADAPTER.validate_python(stations_data)
+            except ValidationError:
+                # Fall back to per-item parsing to skip only the malformed entries
+                stations = []
+                for station_data in stations_data:
+                    try:
+                        station = MevoStation(**station_data)
+                        stations.append(station)
+                    except Exception as e:
+                        logger.warning(f"Failed to parse station {station_data.get('station_id', 'unknown')}: {str(e)}")
+                        continue
             
             logger.info(f"Retrieved {len(stations)} MEVO stations")
             return stations
@@ -196,17 +299,21 @@ class MevoApiClient:
             List[MevoStationStatus]: Current availability and status for all stations
         """
         try:
-            response = await self._make_request(self.base_urls['station_status'])
+            response = await self._make_request(_STATION_STATUS_URL)
             statuses_data = response['data']['stations']
             
-            statuses = []
-            for status_data in statuses_data:
-                try:
-                    status = MevoStationStatus(**status_data)
-                    statuses.append(status)
-                except Exception as e:
-                    logger.warning(f"Failed to parse station status {status_data.get('station_id', 'unknown')}: {str(e)}")
-                    continue
+            try:
+                statuses = _STATUSES_ADAPTER.validate_python(statuses_data)
+            except ValidationError:
+                # Fall back to per-item parsing to skip only the malformed entries
+                statuses = []
+                for status_data in statuses_data:
+                    try:
+                        status = MevoStationStatus(**status_data)
+                        statuses.append(status)
+                    except Exception as e:
+                        logger.warning(f"Failed to parse station status {status_data.get('station_id', 'unknown')}: {str(e)}")
+                        continue
             
             logger.info(f"Retrieved status for {len(statuses)} MEVO stations")
             return statuses
@@ -219,6 +326,10 @@ class MevoApiClient:
         """
         Get information for a specific station.
         
+        Lookups are served from an in-memory index of the station feed that
+        is rebuilt at most once per hour, so repeated calls do not refetch
+        the full feed.
+        
         Args:
             station_id: The MEVO station ID to look up
             
@@ -226,14 +337,15 @@ class MevoApiClient:
             Optional[MevoStation]: Station information if found, None otherwise
         """
         try:
-            stations = await self.get_station_information()
-            
-            for station in stations:
-                if station.station_id == station_id:
-                    return station
+            if time.monotonic() >= self._station_index_expires:
+                stations = await self.get_station_information()
+                self._station_index = {station.station_id: station for station in stations}
+                self._station_index_expires = time.monotonic() + _STATION_INDEX_TTL_SECONDS
             
-            logger.info(f"Station {station_id} not found in MEVO system")
-            return None
+            station = self._station_index.get(station_id)
+            if station is None:
+                logger.info(f"Station {station_id} not found in MEVO system")
+            return station
             
         except Exception as e:
             logger.error(f"Failed to get station {station_id}: {str(e)}")
@@ -256,14 +368,21 @@ class MevoApiClient:
             # Create lookup map for statuses
             status_map = {status.station_id: status for status in statuses}
             
+            # Many stations share a report time, so format each distinct
+            # timestamp once instead of once per station
+            reported_iso = {
+                reported: datetime.fromtimestamp(reported, tz=timezone.utc).isoformat()
+                for reported in {status.last_reported for status in statuses}
+            }
+            
             # Combine data
             combined_data = []
             for station in stations:
                 station_dict = station.model_dump()
                 
                 # Add status if available
-                if station.station_id in status_map:
-                    status = status_map[station.station_id]
+                status = status_map.get(station.station_id)
+                if status is not None:
                     station_dict.update({
                         'num_bikes_available': status.num_bikes_available,
                         'num_docks_available': status.num_docks_available,
@@ -271,9 +390,7 @@ class MevoApiClient:
                         'is_renting': status.is_renting,
                         'is_returning': status.is_returning,
                         'last_reported': status.last_reported,
-                        'last_reported_datetime': datetime.fromtimestamp(
-                            status.last_reported, tz=timezone.utc
-                        ).isoformat()
+                        'last_reported_datetime': reported_iso[status.last_reported]
                     })
                 else:
                     logger.warning(f"No status data for station {station.station_id}")
@@ -298,8 +415,53 @@ class MevoApiClient:
             raise MevoApiError(f"Failed to get combined station data: {str(e)}")
 
 
+# Process-wide client shared by the scheduler and seeding runs
+_shared_client: Optional[MevoApiClient] = None
+
+
+async def get_shared_mevo_client() -> MevoApiClient:
+    """
+    Get the shared MEVO API client, opening it on first use.
+    
+    Reusing one client keeps its keep-alive connections warm between
+    periodic syncs instead of paying DNS, TCP and TLS setup on every run.
+    
+    Returns:
+        MevoApiClient: Open client instance shared across callers
+    """
+    global _shared_client
+    
+    if _shared_client is None:
+        client = MevoApiClient(
+            limits=httpx.Limits(
+                max_connections=64,
+                max_keepalive_connections=64,
+                keepalive_expiry=300
+            )
+        )
+        await client.__aenter__()
+        _shared_client = client
+        logger.info("Opened shared MEVO API client")
+    
+    return _shared_client
+
+
+async def close_shared_mevo_client() -> None:
+    """
+    Close the shared MEVO API client if it was opened.
+    
+    This function should be called during application shutdown.
+    """
+    global _shared_client
+    
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+        logger.info("Closed shared MEVO API client")
+
+
 # Convenience function for creating client instances
-async def create_mevo_client() -> MevoApiClient:
+def create_mevo_client() -> MevoApiClient:
     """
     Create and return a MEVO API client.
     
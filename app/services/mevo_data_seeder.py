@@ -7,22 +7,85 @@ the Supabase database. It manages both initial seeding and incremental updates.
 
 import logging
 import asyncio
-from typing import List, Dict, Any, Optional, Tuple
+import hashlib
+import time
+from collections import Counter, deque
+from typing import Any, Awaitable, Dict, List, Optional, Tuple, TypeVar
 from datetime import datetime, timezone
-from decimal import Decimal
 
-from app.services.mevo_api_client import MevoApiClient, MevoApiError
+from aiolimiter import AsyncLimiter
+
+from app.services.mevo_api_client import (
+    MevoApiClient,
+    MevoApiError,
+    MevoStation,
+    get_shared_mevo_client
+)
 from app.repositories.station_repository import StationRepository
 from app.schemas.station import (
     BikeStationCreate,
-    AvailabilitySnapshotCreate,
-    ApiSyncLogCreate,
     SyncStatus
 )
+from app.core.config import settings
 from app.core.database import SupabaseClient
+from app.utils import geohash
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
+# Station name prefix -> service area
+AREA_MAP = {
+    'GDA': 'Gdańsk',
+    'GPG': 'Gdynia',
+    'SOP': 'Sopot',
+}
+
+# Proactively throttle MEVO requests rather than relying on 429 retries.
+# Shared by every seeder so scheduled syncs and manual triggers draw from
+# one bucket.
+_MEVO_RATE_LIMITER = AsyncLimiter(max_rate=settings.mevo_requests_per_second, time_period=1)
+
+# Maximum snapshot insert requests in flight at once
+_SNAPSHOT_WRITE_CONCURRENCY = 4
+
+# Only the most recent errors of a run are kept, bounding memory and the
+# size of the sync log's error_message during failure storms
+_MAX_RECORDED_ERRORS = 100
+
+# How long status syncs reuse the cached station lookup
+_STATION_LOOKUP_TTL_SECONDS = 3600
+
+# Maximum stations sent in one upsert request
+_STATION_UPSERT_BATCH_SIZE = 500
+
+# Maximum station upsert requests in flight at once
+_STATION_UPSERT_CONCURRENCY = 4
+
+
+def _station_content_hash(mevo_station: MevoStation) -> int:
+    """
+    Compute a stable 64-bit hash of the station fields we store.
+    
+    Python's built-in hash() is salted per process, so a blake2b digest is
+    used instead to keep values comparable across runs.
+    
+    Args:
+        mevo_station: Station data from MEVO API
+        
+    Returns:
+        int: Signed 64-bit hash, matching a BIGINT column
+    """
+    content = repr((
+        mevo_station.name,
+        mevo_station.address,
+        float(mevo_station.lat),
+        float(mevo_station.lon),
+        mevo_station.capacity,
+    ))
+    digest = hashlib.blake2b(content.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
 
 class MevoDataSeeder:
     """
@@ -32,87 +95,131 @@ class MevoDataSeeder:
     repository to ensure data consistency and proper error handling.
     """
     
-    def __init__(self, db: SupabaseClient):
+    def __init__(self, db: SupabaseClient, mevo_client: Optional[MevoApiClient] = None):
         """
         Initialize the data seeder.
         
         Args:
             db: Supabase database client
+            mevo_client: Open MEVO API client to use; defaults to the shared client
         """
         self.db = db
         self.repository = StationRepository(db)
+        self.mevo_client = mevo_client
+        self._station_lookup_cache: Optional[Tuple[float, Dict[str, Any]]] = None
     
-    async def seed_initial_stations(self) -> Dict[str, Any]:
+    async def _get_mevo_client(self) -> MevoApiClient:
+        """
+        Get the MEVO API client for this seeder.
+        
+        Returns:
+            MevoApiClient: The injected client, or the shared process-wide client
+        """
+        return self.mevo_client or await get_shared_mevo_client()
+    
+    async def _rate_limited(self, request: Awaitable[T]) -> T:
+        """
+        Await a MEVO API request once the process-wide rate limiter allows it.
+        
+        Args:
+            request: Pending MEVO client call
+            
+        Returns:
+            The result of the request
+        """
+        async with _MEVO_RATE_LIMITER:
+            return await request
+    
+    async def seed_initial_stations(self, stations: Optional[List[MevoStation]] = None) -> Dict[str, Any]:
         """
         Perform initial seeding of MEVO stations.
         
         Fetches all stations from MEVO API and stores them in the database.
         This should be run once during initial setup.
         
+        Args:
+            stations: Stations already fetched by the caller; when given, the
+                MEVO API is not queried again
+        
         Returns:
             Dict containing seeding statistics and results
         """
         start_time = datetime.now(timezone.utc)
+        start_ns = time.monotonic_ns()
         stats = {
             'start_time': start_time.isoformat(),
             'stations_fetched': 0,
             'stations_created': 0,
             'stations_updated': 0,
+            'stations_unchanged': 0,
             'stations_skipped': 0,
-            'errors': [],
+            'errors': deque(maxlen=_MAX_RECORDED_ERRORS),
             'success': False
         }
         
         try:
             logger.info("Starting MEVO initial station seeding")
             
-            async with MevoApiClient() as mevo_client:
-                # Fetch system information first
-                try:
-                    system_info = await mevo_client.get_system_information()
-                    logger.info(f"Connected to {system_info.name} system (ID: {system_info.system_id})")
-                except Exception as e:
-                    logger.error(f"Failed to fetch system info: {str(e)}")
-                    stats['errors'].append(f"System info error: {str(e)}")
+            if stations is None:
+                mevo_client = await self._get_mevo_client()
                 
-                # Fetch all stations
-                stations = await mevo_client.get_station_information()
-                stats['stations_fetched'] = len(stations)
-                
-                logger.info(f"Fetched {len(stations)} stations from MEVO API")
-                
-                # Process stations in batches for better performance
-                await self._process_stations_batch(stations, stats)
-                
-                # Create sync log entry
-                end_time = datetime.now(timezone.utc)
-                response_time_ms = int((end_time - start_time).total_seconds() * 1000)
-                
-                sync_status = SyncStatus.SUCCESS if not stats['errors'] else (
-                    SyncStatus.PARTIAL if stats['stations_created'] > 0 else SyncStatus.FAILED
-                )
-                
-                sync_log = ApiSyncLogCreate(
-                    sync_timestamp=start_time,
-                    sync_status=sync_status,
-                    stations_updated=stats['stations_created'] + stats['stations_updated'],
-                    snapshots_created=0,  # No snapshots in initial seeding
-                    error_message='; '.join(stats['errors']) if stats['errors'] else None,
-                    response_time_ms=response_time_ms
+                # Fetch system information and all stations concurrently
+                system_info, fetched_stations = await asyncio.gather(
+                    self._rate_limited(mevo_client.get_system_information()),
+                    self._rate_limited(mevo_client.get_station_information()),
+                    return_exceptions=True
                 )
                 
-                try:
-                    await self.repository.create_sync_log(sync_log)
-                except Exception as e:
-                    logger.error(f"Failed to create sync log: {str(e)}")
-                
-                stats['success'] = sync_status in [SyncStatus.SUCCESS, SyncStatus.PARTIAL]
-                stats['end_time'] = end_time.isoformat()
-                stats['duration_ms'] = response_time_ms
-                
-                logger.info(f"Initial seeding completed: {stats}")
-                return stats
+                # System info is informational only; a failure is recorded but not fatal
+                if isinstance(system_info, Exception):
+                    logger.error(f"Failed to fetch system info: {str(system_info)}")
+                    stats['errors'].append(f"System info error: {str(system_info)}")
+                else:
+                    logger.info(f"Connected to {system_info.name} system (ID: {system_info.system_id})")
                 
+                if isinstance(fetched_stations, BaseException):
+                    raise fetched_stations
+                stations = fetched_stations
+            
+            stats['stations_fetched'] = len(stations)
+            
+            logger.info(f"Fetched {len(stations)} stations from MEVO API")
+            
+            # Process stations in batches for better performance
+            await self._process_stations_batch(stations, stats)
+            
+            # Station rows changed; the next status sync must see them
+            self._station_lookup_cache = None
+            
+            # Create sync log entry
+            end_time = datetime.now(timezone.utc)
+            response_time_ms = (time.monotonic_ns() - start_ns) // 1_000_000
+            
+            sync_status = SyncStatus.SUCCESS if not stats['errors'] else (
+                SyncStatus.PARTIAL if stats['stations_created'] > 0 else SyncStatus.FAILED
+            )
+            
+            sync_log = {
+                'sync_timestamp': start_time.isoformat(),
+                'sync_status': sync_status.value,
+                'stations_updated': stats['stations_created'] + stats['stations_updated'],
+                'snapshots_created': 0,  # No snapshots in initial seeding
+                'error_message': '; '.join(stats['errors']) or None,
+                'response_time_ms': response_time_ms
+            }
+            
+            try:
+                await self.repository.create_sync_log_raw(sync_log)
+            except Exception as e:
+                logger.error(f"Failed to create sync log: {str(e)}")
+            
+            stats['success'] = sync_status in [SyncStatus.SUCCESS, SyncStatus.PARTIAL]
+            stats['end_time'] = end_time.isoformat()
+            stats['duration_ms'] = response_time_ms
+            
+            logger.info(f"Initial seeding completed: {stats}")
+            return stats
+            
         except MevoApiError as e:
             error_msg = f"MEVO API error during seeding: {str(e)}"
             logger.error(error_msg)
@@ -136,55 +243,63 @@ class MevoDataSeeder:
             Dict containing sync statistics and results
         """
         start_time = datetime.now(timezone.utc)
+        start_ns = time.monotonic_ns()
         stats = {
             'start_time': start_time.isoformat(),
             'stations_processed': 0,
             'snapshots_created': 0,
-            'errors': [],
+            'errors': deque(maxlen=_MAX_RECORDED_ERRORS),
             'success': False
         }
         
         try:
             logger.info("Starting MEVO station status sync")
             
-            async with MevoApiClient() as mevo_client:
-                # Get current status for all stations
-                station_statuses = await mevo_client.get_station_status()
-                
-                logger.info(f"Fetched status for {len(station_statuses)} stations")
-                
-                # Process station statuses in batch for better performance
-                await self._process_station_statuses_batch(station_statuses, start_time, stats)
-                
-                # Create sync log entry
-                end_time = datetime.now(timezone.utc)
-                response_time_ms = int((end_time - start_time).total_seconds() * 1000)
-                
-                sync_status = SyncStatus.SUCCESS if not stats['errors'] else (
-                    SyncStatus.PARTIAL if stats['snapshots_created'] > 0 else SyncStatus.FAILED
-                )
-                
-                sync_log = ApiSyncLogCreate(
-                    sync_timestamp=start_time,
-                    sync_status=sync_status,
-                    stations_updated=stats['stations_processed'],
-                    snapshots_created=stats['snapshots_created'],
-                    error_message='; '.join(stats['errors']) if stats['errors'] else None,
-                    response_time_ms=response_time_ms
-                )
-                
-                try:
-                    await self.repository.create_sync_log(sync_log)
-                except Exception as e:
-                    logger.error(f"Failed to create sync log: {str(e)}")
-                
-                stats['success'] = sync_status in [SyncStatus.SUCCESS, SyncStatus.PARTIAL]
-                stats['end_time'] = end_time.isoformat()
-                stats['duration_ms'] = response_time_ms
-                
-                logger.info(f"Status sync completed: {stats}")
-                return stats
-                
+            mevo_client = await self._get_mevo_client()
+            
+            # Fetch current status from MEVO while the station lookup is loaded
+            # from the database - the two are independent
+            station_statuses, station_lookup = await asyncio.gather(
+                self._rate_limited(mevo_client.get_station_status()),
+                self._get_station_lookup()
+            )
+            
+            logger.info(f"Fetched status for {len(station_statuses)} stations")
+            
+            # Process station statuses in batch for better performance
+            await self._process_station_statuses_batch(
+                station_statuses, station_lookup, start_time, stats
+            )
+            
+            # Create sync log entry
+            end_time = datetime.now(timezone.utc)
+            response_time_ms = (time.monotonic_ns() - start_ns) // 1_000_000
+            
+            sync_status = SyncStatus.SUCCESS if not stats['errors'] else (
+                SyncStatus.PARTIAL if stats['snapshots_created'] > 0 else SyncStatus.FAILED
+            )
+            
+            sync_log = {
+                'sync_timestamp': start_time.isoformat(),
+                'sync_status': sync_status.value,
+                'stations_updated': stats['stations_processed'],
+                'snapshots_created': stats['snapshots_created'],
+                'error_message': '; '.join(stats['errors']) or None,
+                'response_time_ms': response_time_ms
+            }
+            
+            try:
+                await self.repository.create_sync_log_raw(sync_log)
+            except Exception as e:
+                logger.error(f"Failed to create sync log: {str(e)}")
+            
+            stats['success'] = sync_status in [SyncStatus.SUCCESS, SyncStatus.PARTIAL]
+            stats['end_time'] = end_time.isoformat()
+            stats['duration_ms'] = response_time_ms
+            
+            logger.info(f"Status sync completed: {stats}")
+            return stats
+            
         except MevoApiError as e:
             error_msg = f"MEVO API error during status sync: {str(e)}"
             logger.error(error_msg)
@@ -206,143 +321,136 @@ class MevoDataSeeder:
             stats: Statistics dictionary to update
         """
         try:
-            # Separate new stations from existing ones
-            new_stations = []
-            stations_to_update = []
+            # Load existing stations once instead of one lookup per station
+            existing_stations = await self._get_station_lookup(refresh=True)
+            
+            # First pass: validate every station, collecting failures instead
+            # of handling them one at a time
+            valid_stations: List[BikeStationCreate] = []
+            invalid_stations: List[Tuple[str, Exception]] = []
             
-            # Check which stations already exist
             for mevo_station in mevo_stations:
                 try:
-                    existing_station = await self.repository.get_station_by_external_id(
-                        mevo_station.station_id
-                    )
-                    
-                    station_data = BikeStationCreate(
+                    valid_stations.append(BikeStationCreate(
                         external_station_id=mevo_station.station_id,
                         name=mevo_station.name,
                         address=mevo_station.address,  # Include address from MEVO API
-                        latitude=Decimal(str(mevo_station.lat)),
-                        longitude=Decimal(str(mevo_station.lon)),
+                        latitude=mevo_station.lat,
+                        longitude=mevo_station.lon,
                         total_docks=mevo_station.capacity,  # Virtual station capacity
-                        is_active=True
-                    )
-                    
-                    if existing_station:
-                        stations_to_update.append((existing_station, station_data))
-                    else:
-                        new_stations.append(station_data)
-                        
+                        is_active=True,
+                        content_hash=_station_content_hash(mevo_station),
+                        geohash6=geohash.encode(mevo_station.lat, mevo_station.lon, precision=6)
+                    ))
                 except Exception as e:
-                    error_msg = f"Error processing station {mevo_station.station_id}: {str(e)}"
-                    logger.error(error_msg)
-                    stats['errors'].append(error_msg)
-                    stats['stations_skipped'] += 1
+                    invalid_stations.append((mevo_station.station_id, e))
             
-            # Batch create new stations
-            if new_stations:
-                try:
-                    created_stations = await self.repository.create_stations_batch(new_stations)
-                    stats['stations_created'] += len(created_stations)
-                    logger.info(f"Created {len(created_stations)} new stations in batch")
-                except Exception as e:
-                    error_msg = f"Error creating stations batch: {str(e)}"
-                    logger.error(error_msg)
-                    stats['errors'].append(error_msg)
-                    stats['stations_skipped'] += len(new_stations)
+            if invalid_stations:
+                logger.error(f"{len(invalid_stations)} MEVO stations failed validation, skipping")
+                stats['errors'].extend(
+                    f"Error processing station {station_id}: {str(e)}"
+                    for station_id, e in invalid_stations
+                )
+                stats['stations_skipped'] += len(invalid_stations)
+            
+            # Second pass: drop stations whose source data hasn't changed since
+            # the last seed (rows seeded before geohashes existed are rewritten
+            # once to backfill them). Payloads are keyed by external ID so a
+            # station listed twice in the feed doesn't hit the same row twice
+            # in one upsert.
+            stations_to_upsert: Dict[str, BikeStationCreate] = {}
             
-            # Update existing stations (done individually for now)
-            for existing_station, station_data in stations_to_update:
+            for station_data in valid_stations:
+                existing_station = existing_stations.get(station_data.external_station_id)
+                if (
+                    existing_station is not None
+                    and existing_station.is_active
+                    and existing_station.content_hash == station_data.content_hash
+                    and existing_station.geohash6 is not None
+                ):
+                    stats['stations_unchanged'] += 1
+                    continue
+                
+                stations_to_upsert[station_data.external_station_id] = station_data
+            
+            payloads = list(stations_to_upsert.values())
+            
+            # First seed into an empty table: bulk-load with COPY when a direct
+            # connection is configured, otherwise use the upsert path below
+            if payloads and not existing_stations:
                 try:
-                    from app.schemas.station import BikeStationUpdate
-                    update_data = BikeStationUpdate(
-                        name=station_data.name,
-                        address=station_data.address,  # Include address in updates
-                        latitude=station_data.latitude,
-                        longitude=station_data.longitude,
-                        total_docks=station_data.total_docks,
-                        is_active=station_data.is_active
-                    )
-                    
-                    updated_station = await self.repository.update_station(
-                        existing_station.id, update_data
-                    )
-                    
-                    if updated_station:
-                        stats['stations_updated'] += 1
-                    else:
-                        stats['stations_skipped'] += 1
-                        
+                    if await self.repository.supports_copy():
+                        copied_count = await self.repository.copy_stations(payloads)
+                        stats['stations_created'] += copied_count
+                        logger.info(f"Copied {copied_count} new stations into empty table")
+                        return
                 except Exception as e:
-                    error_msg = f"Error updating station {existing_station.external_station_id}: {str(e)}"
-                    logger.error(error_msg)
-                    stats['errors'].append(error_msg)
-                    stats['stations_skipped'] += 1
+                    logger.warning(f"Station COPY failed, falling back to upsert: {str(e)}")
+            
+            # Insert new and update existing stations with one upsert per chunk,
+            # keeping each request under PostgREST's payload limit. Chunks are
+            # sent concurrently so one request's round trip overlaps the next.
+            semaphore = asyncio.Semaphore(_STATION_UPSERT_CONCURRENCY)
+            
+            async def upsert_chunk(chunk: List[BikeStationCreate]) -> None:
+                async with semaphore:
+                    try:
+                        upserted_stations = await self.repository.upsert_stations_batch(chunk)
+                    except Exception as e:
+                        error_msg = f"Error upserting stations batch: {str(e)}"
+                        logger.error(error_msg)
+                        stats['errors'].append(error_msg)
+                        stats['stations_skipped'] += len(chunk)
+                        return
+                
+                created_count = sum(
+                    1 for station in upserted_stations
+                    if station.external_station_id not in existing_stations
+                )
+                stats['stations_created'] += created_count
+                stats['stations_updated'] += len(upserted_stations) - created_count
+                stats['stations_skipped'] += len(chunk) - len(upserted_stations)
+                logger.info(
+                    f"Upserted {len(upserted_stations)} stations in batch "
+                    f"({created_count} new, {len(upserted_stations) - created_count} updated)"
+                )
+            
+            await asyncio.gather(*(
+                upsert_chunk(payloads[i:i + _STATION_UPSERT_BATCH_SIZE])
+                for i in range(0, len(payloads), _STATION_UPSERT_BATCH_SIZE)
+            ))
                     
         except Exception as e:
             logger.error(f"Error in batch station processing: {str(e)}")
             raise
 
-    async def _process_station(self, mevo_station, stats: Dict[str, Any]) -> None:
+    async def _get_station_lookup(self, refresh: bool = False) -> Dict[str, Any]:
         """
-        Process a single MEVO station for database storage.
+        Get all database stations keyed by their external (MEVO) station ID.
+        
+        Station topology changes rarely, so the lookup is cached on the seeder
+        for _STATION_LOOKUP_TTL_SECONDS and shared by consecutive status syncs.
         
         Args:
-            mevo_station: Station data from MEVO API
-            stats: Statistics dictionary to update
-        """
-        try:
-            # Check if station already exists
-            existing_station = await self.repository.get_station_by_external_id(
-                mevo_station.station_id
-            )
+            refresh: Bypass the cache and reload stations from the database
             
-            # For MEVO virtual stations, use capacity as total_docks
-            # This maps the virtual station concept to our physical dock model
-            station_data = BikeStationCreate(
-                external_station_id=mevo_station.station_id,
-                name=mevo_station.name,
-                address=mevo_station.address,  # Include address from MEVO API
-                latitude=Decimal(str(mevo_station.lat)),
-                longitude=Decimal(str(mevo_station.lon)),
-                total_docks=mevo_station.capacity,  # Virtual station capacity
-                is_active=True
-            )
-            
-            if existing_station:
-                # Update existing station
-                from app.schemas.station import BikeStationUpdate
-                update_data = BikeStationUpdate(
-                    name=station_data.name,
-                    address=station_data.address,  # Include address in updates
-                    latitude=station_data.latitude,
-                    longitude=station_data.longitude,
-                    total_docks=station_data.total_docks,
-                    is_active=station_data.is_active
-                )
-                
-                updated_station = await self.repository.update_station(
-                    existing_station.id, update_data
-                )
-                
-                if updated_station:
-                    logger.info(f"Updated station: {updated_station.name} (ID: {updated_station.external_station_id})")
-                    stats['stations_updated'] += 1
-                else:
-                    logger.warning(f"Failed to update station {mevo_station.station_id}")
-                    stats['stations_skipped'] += 1
-            else:
-                # Create new station
-                new_station = await self.repository.create_station(station_data)
-                logger.info(f"Created station: {new_station.name} (ID: {new_station.external_station_id})")
-                stats['stations_created'] += 1
-                
-        except Exception as e:
-            logger.error(f"Error processing station {mevo_station.station_id}: {str(e)}")
-            raise
+        Returns:
+            Dict mapping external station ID to station
+        """
+        if not refresh and self._station_lookup_cache is not None:
+            loaded_at, lookup = self._station_lookup_cache
+            if time.monotonic() - loaded_at < _STATION_LOOKUP_TTL_SECONDS:
+                return lookup
+        
+        all_stations = await self.repository.get_all_stations(active_only=False)
+        lookup = {station.external_station_id: station for station in all_stations}
+        self._station_lookup_cache = (time.monotonic(), lookup)
+        return lookup
     
     async def _process_station_statuses_batch(
         self, 
         station_statuses, 
+        station_lookup: Dict[str, Any],
         timestamp: datetime, 
         stats: Dict[str, Any]
     ) -> None:
@@ -351,57 +459,48 @@ class MevoDataSeeder:
         
         Args:
             station_statuses: List of station status data from MEVO API
+            station_lookup: Database stations keyed by external station ID
             timestamp: Timestamp for the snapshots
             stats: Statistics dictionary to update
         """
         try:
-            # Get all stations from database for lookup
-            all_stations = await self.repository.get_all_stations(active_only=False)
-            station_lookup = {station.external_station_id: station for station in all_stations}
+            # Time-based fields are the same for every snapshot in this sync
+            day_of_week = timestamp.isoweekday()  # 1=Monday, 7=Sunday
+            hour = timestamp.hour
+            minute_slot = (timestamp.minute // 15) * 15  # Round to 15-minute intervals
             
-            # Build batch of snapshots
-            snapshots_to_create = []
+            timestamp_iso = timestamp.isoformat()
             
-            for status in station_statuses:
-                try:
-                    station = station_lookup.get(status.station_id)
-                    
-                    if not station:
-                        logger.warning(f"Station {status.station_id} not found in database, skipping status")
-                        continue
-                    
-                    # Calculate time-based fields
-                    day_of_week = timestamp.isoweekday()  # 1=Monday, 7=Sunday
-                    hour = timestamp.hour
-                    minute_slot = (timestamp.minute // 15) * 15  # Round to 15-minute intervals
-                    
-                    # Create availability snapshot data
-                    snapshot_data = AvailabilitySnapshotCreate(
-                        station_id=station.id,
-                        available_bikes=status.num_bikes_available,
-                        available_docks=status.num_docks_available,
-                        is_renting=status.is_renting,
-                        is_returning=status.is_returning,
-                        timestamp=timestamp,
-                        day_of_week=day_of_week,
-                        hour=hour,
-                        minute_slot=minute_slot
-                    )
-                    
-                    snapshots_to_create.append(snapshot_data)
-                    stats['stations_processed'] += 1
-                    
-                except Exception as e:
-                    error_msg = f"Error preparing snapshot for station {status.station_id}: {str(e)}"
-                    logger.error(error_msg)
-                    stats['errors'].append(error_msg)
+            # Build batch of snapshot rows for statuses of known stations. The
+            # values come from already-validated MEVO models, so rows are built
+            # as plain dicts instead of re-validating each one with Pydantic.
+            snapshots_to_create = [
+                {
+                    'station_id': station_lookup[status.station_id].id,
+                    'available_bikes': status.num_bikes_available,
+                    'available_docks': status.num_docks_available,
+                    'is_renting': status.is_renting,
+                    'is_returning': status.is_returning,
+                    'timestamp': timestamp_iso,
+                    'day_of_week': day_of_week,
+                    'hour': hour,
+                    'minute_slot': minute_slot
+                }
+                for status in station_statuses
+                if status.station_id in station_lookup
+            ]
+            stats['stations_processed'] += len(snapshots_to_create)
+            
+            skipped = len(station_statuses) - len(snapshots_to_create)
+            if skipped:
+                logger.warning(f"{skipped} station statuses have no matching station in database, skipping")
             
             # Batch create all snapshots
             if snapshots_to_create:
                 try:
-                    created_snapshots = await self.repository.create_availability_snapshots_batch(snapshots_to_create)
-                    stats['snapshots_created'] += len(created_snapshots)
-                    logger.info(f"Created {len(created_snapshots)} availability snapshots in batch")
+                    snapshots_created = await self._write_snapshots(snapshots_to_create, timestamp, stats)
+                    stats['snapshots_created'] += snapshots_created
+                    logger.info(f"Created {snapshots_created} availability snapshots in batch")
                 except Exception as e:
                     error_msg = f"Error creating snapshots batch: {str(e)}"
                     logger.error(error_msg)
@@ -411,56 +510,74 @@ class MevoDataSeeder:
             logger.error(f"Error in batch status processing: {str(e)}")
             raise
 
-    async def _process_station_status(
-        self, 
-        status, 
-        timestamp: datetime, 
+    async def _write_snapshots(
+        self,
+        snapshots: List[Dict[str, Any]],
+        timestamp: datetime,
         stats: Dict[str, Any]
-    ) -> None:
+    ) -> int:
         """
-        Process station status and create availability snapshot.
+        Write availability snapshot rows using the fastest available path.
+        
+        Uses PostgreSQL COPY when a direct database connection is configured.
+        Otherwise, or if the COPY fails (it is a single statement, so nothing
+        was written), rows are split into chunks of SNAPSHOT_BATCH_SIZE to
+        stay within PostgREST request-size limits, and the chunks are
+        inserted concurrently. A failed chunk does not roll back the others,
+        so it is recorded in stats['errors'] and the rest are still counted.
         
         Args:
-            status: Station status from MEVO API
-            timestamp: Timestamp for the snapshot
-            stats: Statistics dictionary to update
+            snapshots: JSON-ready snapshot rows
+            timestamp: Snapshot timestamp, needed as a datetime for COPY
+            stats: Statistics dictionary receiving per-chunk errors
+            
+        Returns:
+            int: Number of snapshots created
         """
         try:
-            # Find the corresponding station in our database
-            station = await self.repository.get_station_by_external_id(status.station_id)
-            
-            if not station:
-                logger.warning(f"Station {status.station_id} not found in database, skipping status")
-                return
-            
-            # Calculate time-based fields
-            day_of_week = timestamp.isoweekday()  # 1=Monday, 7=Sunday
-            hour = timestamp.hour
-            minute_slot = (timestamp.minute // 15) * 15  # Round to 15-minute intervals
-            
-            # Create availability snapshot
-            snapshot_data = AvailabilitySnapshotCreate(
-                station_id=station.id,
-                available_bikes=status.num_bikes_available,
-                available_docks=status.num_docks_available,
-                is_renting=status.is_renting,
-                is_returning=status.is_returning,
-                timestamp=timestamp,
-                day_of_week=day_of_week,
-                hour=hour,
-                minute_slot=minute_slot
-            )
-            
-            snapshot = await self.repository.create_availability_snapshot(snapshot_data)
-            logger.debug(f"Created availability snapshot for station {station.name}")
-            
-            stats['stations_processed'] += 1
-            stats['snapshots_created'] += 1
-            
+            if await self.repository.supports_copy():
+                # Tuples ordered as SNAPSHOT_COPY_COLUMNS
+                records = [
+                    (
+                        row['station_id'],
+                        row['available_bikes'],
+                        row['available_docks'],
+                        row['is_renting'],
+                        row['is_returning'],
+                        timestamp,
+                        row['day_of_week'],
+                        row['hour'],
+                        row['minute_slot']
+                    )
+                    for row in snapshots
+                ]
+                return await self.repository.copy_availability_snapshots(records)
         except Exception as e:
-            logger.error(f"Error processing status for station {status.station_id}: {str(e)}")
-            raise
-    
+            logger.warning(f"Snapshot COPY failed, falling back to batch insert: {str(e)}")
+        
+        batch_size = settings.snapshot_batch_size
+        chunks = [snapshots[i:i + batch_size] for i in range(0, len(snapshots), batch_size)]
+        semaphore = asyncio.Semaphore(_SNAPSHOT_WRITE_CONCURRENCY)
+        
+        async def write_chunk(chunk: List[Dict[str, Any]]) -> int:
+            async with semaphore:
+                return await self.repository.create_availability_snapshots_raw(chunk)
+        
+        results = await asyncio.gather(
+            *(write_chunk(chunk) for chunk in chunks),
+            return_exceptions=True
+        )
+        
+        snapshots_created = 0
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, Exception):
+                error_msg = f"Error creating snapshots batch of {len(chunk)}: {str(result)}"
+                logger.error(error_msg)
+                stats['errors'].append(error_msg)
+            else:
+                snapshots_created += result
+        return snapshots_created
+
     async def get_seeding_summary(self) -> Dict[str, Any]:
         """
         Get summary of current database state.
@@ -469,8 +586,19 @@ class MevoDataSeeder:
             Dict containing database statistics
         """
         try:
-            # Get all stations
-            stations = await self.repository.get_all_stations(active_only=False)
+            # Count stations per area in the database rather than loading every row
+            try:
+                area_counts = await self.repository.get_station_counts_by_area()
+                total_stations = sum(row['station_count'] for row in area_counts)
+                active_stations = sum(row['active_count'] for row in area_counts)
+                stations_by_area = {row['area']: row['station_count'] for row in area_counts}
+            except Exception as e:
+                # Fallback to Python-based counting if database function doesn't exist
+                logger.warning(f"Database function failed, falling back to Python counting: {str(e)}")
+                stations = await self.repository.get_all_stations(active_only=False)
+                total_stations = len(stations)
+                active_stations = sum(1 for s in stations if s.is_active)
+                stations_by_area = self._group_stations_by_area(stations)
             
             # Get recent sync logs
             recent_logs = await self.repository.get_recent_sync_logs(limit=5)
@@ -479,9 +607,9 @@ class MevoDataSeeder:
             # Note: This might need a custom query for better performance
             
             summary = {
-                'total_stations': len(stations),
-                'active_stations': len([s for s in stations if s.is_active]),
-                'inactive_stations': len([s for s in stations if not s.is_active]),
+                'total_stations': total_stations,
+                'active_stations': active_stations,
+                'inactive_stations': total_stations - active_stations,
                 'recent_syncs': [
                     {
                         'timestamp': log.sync_timestamp.isoformat(),
@@ -492,7 +620,7 @@ class MevoDataSeeder:
                     }
                     for log in recent_logs
                 ],
-                'stations_by_area': self._group_stations_by_area(stations)
+                'stations_by_area': stations_by_area
             }
             
             return summary
@@ -511,19 +639,4 @@ class MevoDataSeeder:
         Returns:
             Dict with area counts
         """
-        areas = {}
-        
-        for station in stations:
-            # Extract area from station name prefix
-            if station.name.startswith('GDA'):
-                area = 'Gdańsk'
-            elif station.name.startswith('GPG'):
-                area = 'Gdynia'
-            elif station.name.startswith('SOP'):
-                area = 'Sopot'
-            else:
-                area = 'Other'
-            
-            areas[area] = areas.get(area, 0) + 1
-        
-        return areas
+        return dict(Counter(AREA_MAP.get(station.name[:3], 'Other') for station in stations))
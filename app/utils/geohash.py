@@ -0,0 +1,65 @@
+"""
+Geohash encoding.
+
+Provides a small dependency-free geohash encoder used to tag stations with
+a spatial prefix, so stations in the same area share a common key that can
+be indexed and range-scanned (e.g. ``geohash6 LIKE 'u3d%'``).
+"""
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def encode(latitude: float, longitude: float, precision: int = 6) -> str:
+    """
+    Encode a coordinate pair as a geohash.
+    
+    Args:
+        latitude: Latitude in degrees (-90 to 90)
+        longitude: Longitude in degrees (-180 to 180)
+        precision: Number of geohash characters (6 ≈ 1.2 km × 0.6 km cells)
+        
+    Returns:
+        str: Geohash of the requested precision
+        
+    Raises:
+        ValueError: If the coordinates are out of range or precision < 1
+    """
+    if not -90 <= latitude <= 90 or not -180 <= longitude <= 180:
+        raise ValueError(f"Invalid coordinates: ({latitude}, {longitude})")
+    if precision < 1:
+        raise ValueError(f"Geohash precision must be positive, got {precision}")
+    
+    lat_min, lat_max = -90.0, 90.0
+    lon_min, lon_max = -180.0, 180.0
+    chars = []
+    bits = 0
+    bit_count = 0
+    even_bit = True  # Bits alternate longitude/latitude, starting with longitude
+    
+    while len(chars) < precision:
+        if even_bit:
+            mid = (lon_min + lon_max) / 2
+            if longitude >= mid:
+                bits = (bits << 1) | 1
+                lon_min = mid
+            else:
+                bits <<= 1
+                lon_max = mid
+        else:
+            mid = (lat_min + lat_max) / 2
+            if latitude >= mid:
+                bits = (bits << 1) | 1
+                lat_min = mid
+            else:
+                bits <<= 1
+                lat_max = mid
+        even_bit = not even_bit
+        bit_count += 1
+        
+        # Every 5 bits make one base32 character
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits = 0
+            bit_count = 0
+    
+    return "".join(chars)
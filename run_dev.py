@@ -9,6 +9,8 @@ Usage:
     python run_dev.py
 """
 
+import sys
+
 import uvicorn
 
 if __name__ == "__main__":
@@ -17,5 +19,8 @@ if __name__ == "__main__":
         host="127.0.0.1",
         port=8000,
         reload=True,
-        log_level="info"
+        log_level="info",
+        # uvloop drives the scheduler and HTTP client; it is POSIX-only
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
     )
@@ -10,6 +10,7 @@ Usage:
     
 Environment Variables:
     All Supabase and API configuration should be set via .env file
+    SEED_NON_INTERACTIVE: Set to any value to seed without the confirmation prompt
 """
 
 import asyncio
@@ -17,6 +18,7 @@ import sys
 import os
 from pathlib import Path
 import logging
+from collections import Counter
 from datetime import datetime
 import json
 
@@ -24,10 +26,22 @@ import json
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+import httpx
+
+from app.core.config import settings
 from app.core.database import db
-from app.services.mevo_data_seeder import MevoDataSeeder
+from app.services.mevo_data_seeder import AREA_MAP, MevoDataSeeder
 from app.services.mevo_api_client import MevoApiClient
 
+logger = logging.getLogger(__name__)
+
+# Upper bound on the combined MEVO fetch, in seconds
+FETCH_TIMEOUT_SECONDS = 30
+
+# Timestamp formats for displayed report times and log file names
+TS_FMT = "%Y-%m-%d %H:%M:%S"
+LOG_FILE_TS_FMT = "%Y%m%d_%H%M%S"
+
 
 def setup_logging():
     """Configure logging for the seeding script."""
@@ -36,133 +50,125 @@ def setup_logging():
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         handlers=[
             logging.StreamHandler(sys.stdout),
-            logging.FileHandler(f"mevo_seed_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
+            logging.FileHandler(f"mevo_seed_{datetime.now().strftime(LOG_FILE_TS_FMT)}.log")
         ]
     )
 
 
-async def test_mevo_connection():
-    """Test connection to MEVO API and display system information."""
-    print("🔗 Testing MEVO API connection...")
+def display_system_info(system_info):
+    """Display MEVO system information."""
+    print(f"✅ Connected to {system_info.name}")
+    print(f"   System ID: {system_info.system_id}")
+    print(f"   Operator: {system_info.operator}")
+    print(f"   Timezone: {system_info.timezone}")
+    print(f"   Language: {system_info.language}")
+    print(f"   Contact: {system_info.email}")
+    print()
+
+
+def display_stations(stations):
+    """Display a sample of MEVO stations and counts by area."""
+    print(f"✅ Found {len(stations)} MEVO stations")
+    print()
     
-    try:
-        async with MevoApiClient() as client:
-            # Get system information
-            system_info = await client.get_system_information()
-            
-            print(f"✅ Connected to {system_info.name}")
-            print(f"   System ID: {system_info.system_id}")
-            print(f"   Operator: {system_info.operator}")
-            print(f"   Timezone: {system_info.timezone}")
-            print(f"   Language: {system_info.language}")
-            print(f"   Contact: {system_info.email}")
-            print()
-            
-            return True
-            
-    except Exception as e:
-        print(f"❌ Failed to connect to MEVO API: {str(e)}")
-        return False
+    # Display sample stations
+    print("📋 Sample stations:")
+    print("-" * 80)
+    
+    # Build the sample as one buffer and write it in a single call
+    lines = []
+    sample_stations = stations[:5]  # Show first 5 stations
+    for i, station in enumerate(sample_stations, 1):
+        lines.append(
+            f"{i}. {station.name} (ID: {station.station_id})\n"
+            f"   📍 Location: {station.lat:.6f}, {station.lon:.6f}\n"
+            f"   🏢 Address: {station.address}\n"
+            f"   🚲 Capacity: {station.capacity} bikes\n"
+            f"   📱 Virtual Station: {station.is_virtual_station}\n"
+        )
+    sys.stdout.write("\n".join(lines) + "\n")
+    
+    if len(stations) > 5:
+        print(f"... and {len(stations) - 5} more stations")
+        print()
+    
+    # Group stations by area
+    areas = Counter(AREA_MAP.get(station.name[:3], 'Other') for station in stations)
+    
+    print("🗺️ Stations by area:")
+    for area, count in areas.most_common():
+        print(f"   {area}: {count} stations")
+    print()
 
 
-async def fetch_and_display_station_sample():
-    """Fetch and display a sample of MEVO stations."""
-    print("📍 Fetching MEVO station data...")
+def display_statuses(statuses):
+    """Display system-wide status statistics and a sample of station statuses."""
+    print(f"✅ Retrieved status for {len(statuses)} stations")
+    print()
     
-    try:
-        async with MevoApiClient() as client:
-            # Get station information
-            stations = await client.get_station_information()
-            
-            print(f"✅ Found {len(stations)} MEVO stations")
-            print()
-            
-            # Display sample stations
-            print("📋 Sample stations:")
-            print("-" * 80)
-            
-            sample_stations = stations[:5]  # Show first 5 stations
-            for i, station in enumerate(sample_stations, 1):
-                print(f"{i}. {station.name} (ID: {station.station_id})")
-                print(f"   📍 Location: {station.lat:.6f}, {station.lon:.6f}")
-                print(f"   🏢 Address: {station.address}")
-                print(f"   🚲 Capacity: {station.capacity} bikes")
-                print(f"   📱 Virtual Station: {station.is_virtual_station}")
-                print()
-            
-            if len(stations) > 5:
-                print(f"... and {len(stations) - 5} more stations")
-                print()
-            
-            # Group stations by area
-            areas = {}
-            for station in stations:
-                if station.name.startswith('GDA'):
-                    area = 'Gdańsk'
-                elif station.name.startswith('GPG'):
-                    area = 'Gdynia'
-                elif station.name.startswith('SOP'):
-                    area = 'Sopot'
-                else:
-                    area = 'Other'
-                areas[area] = areas.get(area, 0) + 1
-            
-            print("🗺️ Stations by area:")
-            for area, count in areas.items():
-                print(f"   {area}: {count} stations")
-            print()
-            
-            return stations
-            
-    except Exception as e:
-        print(f"❌ Failed to fetch station data: {str(e)}")
-        return []
+    # Calculate statistics in a single pass
+    total_bikes = total_docks = renting_stations = returning_stations = 0
+    for status in statuses:
+        total_bikes += status.num_bikes_available
+        total_docks += status.num_docks_available
+        renting_stations += status.is_renting
+        returning_stations += status.is_returning
+    
+    print("📈 System-wide statistics:")
+    print(f"   🚲 Total available bikes: {total_bikes}")
+    print(f"   🅿️ Total available docks: {total_docks}")
+    print(f"   ✅ Stations accepting rentals: {renting_stations}/{len(statuses)}")
+    print(f"   🔄 Stations accepting returns: {returning_stations}/{len(statuses)}")
+    print()
+    
+    # Show sample station statuses
+    print("📋 Sample station status:")
+    print("-" * 60)
+    
+    # Build the sample as one buffer and write it in a single call
+    lines = []
+    sample_statuses = statuses[:5]
+    for status in sample_statuses:
+        last_reported = datetime.fromtimestamp(status.last_reported).strftime(TS_FMT)
+        lines.append(
+            f"Station {status.station_id}:\n"
+            f"   🚲 Bikes: {status.num_bikes_available}\n"
+            f"   🅿️ Docks: {status.num_docks_available}\n"
+            f"   📅 Last updated: {last_reported}\n"
+            f"   🔄 Renting: {'✅' if status.is_renting else '❌'} | Returning: {'✅' if status.is_returning else '❌'}\n"
+        )
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-async def fetch_and_display_status_sample():
-    """Fetch and display current station status."""
-    print("📊 Fetching current station status...")
+async def fetch_mevo_data(client):
+    """
+    Fetch system info, stations and statuses concurrently.
     
-    try:
-        async with MevoApiClient() as client:
-            # Get station status
-            statuses = await client.get_station_status()
-            
-            print(f"✅ Retrieved status for {len(statuses)} stations")
-            print()
-            
-            # Calculate statistics
-            total_bikes = sum(status.num_bikes_available for status in statuses)
-            total_docks = sum(status.num_docks_available for status in statuses)
-            renting_stations = sum(1 for status in statuses if status.is_renting)
-            returning_stations = sum(1 for status in statuses if status.is_returning)
-            
-            print("📈 System-wide statistics:")
-            print(f"   🚲 Total available bikes: {total_bikes}")
-            print(f"   🅿️ Total available docks: {total_docks}")
-            print(f"   ✅ Stations accepting rentals: {renting_stations}/{len(statuses)}")
-            print(f"   🔄 Stations accepting returns: {returning_stations}/{len(statuses)}")
-            print()
-            
-            # Show sample station statuses
-            print("📋 Sample station status:")
-            print("-" * 60)
-            
-            sample_statuses = statuses[:5]
-            for status in sample_statuses:
-                last_reported = datetime.fromtimestamp(status.last_reported)
-                print(f"Station {status.station_id}:")
-                print(f"   🚲 Bikes: {status.num_bikes_available}")
-                print(f"   🅿️ Docks: {status.num_docks_available}")
-                print(f"   📅 Last updated: {last_reported.strftime('%Y-%m-%d %H:%M:%S')}")
-                print(f"   🔄 Renting: {'✅' if status.is_renting else '❌'} | Returning: {'✅' if status.is_returning else '❌'}")
-                print()
-            
-            return statuses
-            
-    except Exception as e:
-        print(f"❌ Failed to fetch station status: {str(e)}")
-        return []
+    Args:
+        client: Open MEVO API client
+    
+    Returns:
+        Tuple of (system_info, stations, statuses); a failed fetch is
+        returned as its exception instead of aborting the others
+    """
+    return await asyncio.wait_for(
+        asyncio.gather(
+            client.get_system_information(),
+            client.get_station_information(),
+            client.get_station_status(),
+            return_exceptions=True
+        ),
+        timeout=FETCH_TIMEOUT_SECONDS
+    )
+
+
+def create_http_session():
+    """Create the HTTP/2 session shared by every MEVO request in this script."""
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=settings.api_request_timeout,
+        limits=httpx.Limits(max_keepalive_connections=20)
+    )
 
 
 async def test_database_connection():
@@ -185,55 +191,46 @@ async def test_database_connection():
         return False
 
 
-async def seed_database():
-    """Seed the database with MEVO station data."""
-    print("🌱 Starting database seeding...")
+async def seed_database(mevo_client, stations):
+    """Seed the database with already-fetched MEVO station data."""
+    logger.info("🌱 Starting database seeding...")
     
     try:
-        seeder = MevoDataSeeder(db)
-        
-        # Perform initial seeding
-        result = await seeder.seed_initial_stations()
+        seeder = MevoDataSeeder(db, mevo_client=mevo_client)
         
-        print("📊 Seeding Results:")
-        print("-" * 50)
-        print(f"🔍 Stations fetched: {result['stations_fetched']}")
-        print(f"✅ Stations created: {result['stations_created']}")
-        print(f"🔄 Stations updated: {result['stations_updated']}")
-        print(f"⏭️ Stations skipped: {result['stations_skipped']}")
-        print(f"⏱️ Duration: {result.get('duration_ms', 0)} ms")
-        print(f"🎯 Success: {'✅' if result['success'] else '❌'}")
+        # Perform initial seeding with the stations fetched for display
+        result = await seeder.seed_initial_stations(stations=stations)
         
-        if result['errors']:
-            print(f"\n⚠️ Errors encountered:")
-            for error in result['errors']:
-                print(f"   • {error}")
+        logger.info("📊 Seeding Results:")
+        logger.info(f"🔍 Stations fetched: {result['stations_fetched']}")
+        logger.info(f"✅ Stations created: {result['stations_created']}")
+        logger.info(f"🔄 Stations updated: {result['stations_updated']}")
+        logger.info(f"⏸️ Stations unchanged: {result.get('stations_unchanged', 0)}")
+        logger.info(f"⏭️ Stations skipped: {result['stations_skipped']}")
+        logger.info(f"⏱️ Duration: {result.get('duration_ms', 0)} ms")
+        logger.info(f"🎯 Success: {'✅' if result['success'] else '❌'}")
         
-        print()
+        for error in result['errors']:
+            logger.warning(f"⚠️ Error encountered: {error}")
         
         # Get and display summary
         summary = await seeder.get_seeding_summary()
         
-        print("📈 Database Summary:")
-        print("-" * 50)
-        print(f"🏢 Total stations: {summary['total_stations']}")
-        print(f"✅ Active stations: {summary['active_stations']}")
-        print(f"❌ Inactive stations: {summary['inactive_stations']}")
+        logger.info("📈 Database Summary:")
+        logger.info(f"🏢 Total stations: {summary['total_stations']}")
+        logger.info(f"✅ Active stations: {summary['active_stations']}")
+        logger.info(f"❌ Inactive stations: {summary['inactive_stations']}")
         
-        if summary['stations_by_area']:
-            print("\n🗺️ Stations by area:")
-            for area, count in summary['stations_by_area'].items():
-                print(f"   {area}: {count} stations")
+        for area, count in summary['stations_by_area'].items():
+            logger.info(f"🗺️ {area}: {count} stations")
         
-        if summary['recent_syncs']:
-            print(f"\n🔄 Recent sync logs:")
-            for sync in summary['recent_syncs'][:3]:  # Show last 3 syncs
-                print(f"   {sync['timestamp']}: {sync['status']} ({sync['stations_updated']} stations)")
+        for sync in summary['recent_syncs'][:3]:  # Show last 3 syncs
+            logger.info(f"🔄 Recent sync {sync['timestamp']}: {sync['status']} ({sync['stations_updated']} stations)")
         
         return result['success']
         
     except Exception as e:
-        print(f"❌ Seeding failed: {str(e)}")
+        logger.error(f"❌ Seeding failed: {str(e)}")
         return False
 
 
@@ -243,11 +240,34 @@ async def main():
     print("=" * 50)
     print()
     
-    # Test API connection
-    api_ok = await test_mevo_connection()
-    if not api_ok:
+    # One client (and one connection) serves every MEVO request in the script
+    try:
+        async with MevoApiClient(client=create_http_session()) as mevo_client:
+            return await run(mevo_client)
+    finally:
+        # Seeding may have opened the asyncpg pool for COPY
+        await db.close_pool()
+
+
+async def run(mevo_client):
+    """Fetch, display and seed MEVO data using an open client."""
+    # Fetch all MEVO feeds at once
+    print("🔗 Fetching MEVO system, station and status data...")
+    try:
+        system_info, stations, statuses = await fetch_mevo_data(mevo_client)
+    except asyncio.TimeoutError:
+        print(f"❌ MEVO API did not respond within {FETCH_TIMEOUT_SECONDS} seconds")
+        return 1
+    except Exception as e:
+        print(f"❌ Failed to connect to MEVO API: {str(e)}")
+        return 1
+    
+    # Check API connection
+    if isinstance(system_info, Exception):
+        print(f"❌ Failed to connect to MEVO API: {str(system_info)}")
         print("❌ Cannot proceed without API connection")
         return 1
+    display_system_info(system_info)
     
     # Test database connection
     db_ok = await test_database_connection()
@@ -257,30 +277,32 @@ async def main():
     
     print()
     
-    # Fetch and display sample data
-    stations = await fetch_and_display_station_sample()
-    if not stations:
+    # Display sample data
+    if isinstance(stations, Exception) or not stations:
+        if isinstance(stations, Exception):
+            print(f"❌ Failed to fetch station data: {str(stations)}")
         print("❌ Cannot proceed without station data")
         return 1
+    display_stations(stations)
     
-    await fetch_and_display_status_sample()
-    
-    # Ask user if they want to proceed with seeding
-    print("🤔 Do you want to proceed with database seeding? (y/N): ", end="")
-    
-    # For automated testing, we'll proceed automatically
-    # In interactive mode, uncomment the next line:
-    # response = input().strip().lower()
-    response = "y"  # Auto-proceed for script testing
+    if isinstance(statuses, Exception):
+        print(f"❌ Failed to fetch station status: {str(statuses)}")
+    else:
+        display_statuses(statuses)
     
-    if response not in ['y', 'yes']:
-        print("⏹️ Seeding cancelled by user")
-        return 0
+    # Ask user if they want to proceed with seeding; set SEED_NON_INTERACTIVE
+    # to proceed without prompting (e.g. in CI)
+    if not os.environ.get("SEED_NON_INTERACTIVE"):
+        response = input("🤔 Do you want to proceed with database seeding? (y/N): ").strip().lower()
+        
+        if response not in ['y', 'yes']:
+            print("⏹️ Seeding cancelled by user")
+            return 0
     
     print()
     
     # Perform database seeding
-    success = await seed_database()
+    success = await seed_database(mevo_client, stations)
     
     if success:
         print("\n🎉 MEVO data seeding completed successfully!")
@@ -297,6 +319,13 @@ if __name__ == "__main__":
     # Setup logging
     setup_logging()
     
+    # Use uvloop's faster event loop where available (it is POSIX-only)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     # Run the main function
     exit_code = asyncio.run(main())
     sys.exit(exit_code)
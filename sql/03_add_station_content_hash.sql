@@ -0,0 +1,10 @@
+-- Station Content Hash
+-- Track a hash of the MEVO source fields so seeding can skip unchanged stations
+
+-- =====================================================
+-- BIKE_STATIONS.CONTENT_HASH
+-- =====================================================
+
+-- 64-bit hash of (name, address, latitude, longitude, capacity) as last
+-- received from MEVO; NULL for rows written before this column existed
+ALTER TABLE bike_stations ADD COLUMN IF NOT EXISTS content_hash BIGINT;
@@ -0,0 +1,31 @@
+-- Station Counts By Area
+-- Aggregate station counts per service area in the database for summaries
+
+-- =====================================================
+-- STATION_COUNTS_BY_AREA FUNCTION
+-- =====================================================
+
+-- Areas are derived from the station name prefix, matching AREA_MAP in
+-- app/services/mevo_data_seeder.py
+CREATE OR REPLACE FUNCTION station_counts_by_area()
+RETURNS TABLE (
+    area TEXT,
+    station_count INTEGER,
+    active_count INTEGER
+) AS $$
+BEGIN
+    RETURN QUERY
+    SELECT 
+        CASE LEFT(b.name, 3)
+            WHEN 'GDA' THEN 'Gdańsk'
+            WHEN 'GPG' THEN 'Gdynia'
+            WHEN 'SOP' THEN 'Sopot'
+            ELSE 'Other'
+        END::TEXT,
+        COUNT(*)::INTEGER,
+        (COUNT(*) FILTER (WHERE b.is_active))::INTEGER
+    FROM bike_stations b
+    GROUP BY 1
+    ORDER BY 2 DESC;
+END;
+$$ LANGUAGE plpgsql STABLE;
@@ -0,0 +1,20 @@
+-- Station Geohash
+-- Store a level-6 geohash per station for prefix-based spatial queries
+
+-- =====================================================
+-- BIKE_STATIONS.GEOHASH6
+-- =====================================================
+
+-- Level-6 geohash (~1.2 km x 0.6 km cell) of the station location, written
+-- by the MEVO seeder; NULL until the next seed for rows created earlier
+ALTER TABLE bike_stations ADD COLUMN IF NOT EXISTS geohash6 VARCHAR(6);
+
+-- text_pattern_ops lets LIKE 'u3t%' prefix filters use the index
+CREATE INDEX IF NOT EXISTS idx_bike_stations_geohash6
+    ON bike_stations(geohash6 text_pattern_ops);
+
+-- Optional manual step, NOT part of this migration: after the next seed has
+-- backfilled geohash6, physically reorder the table so stations in the same
+-- cell share pages. CLUSTER takes an ACCESS EXCLUSIVE lock and is not
+-- maintained on later writes, so run it in a quiet window:
+--   CLUSTER bike_stations USING idx_bike_stations_geohash6;
@@ -0,0 +1,30 @@
+"""
+Unit tests for geohash encoding.
+
+Tests the geohash encoder against known reference values and its
+input validation.
+"""
+
+import pytest
+
+from app.utils.geohash import encode
+
+
+class TestGeohashEncode:
+    """Test cases for geohash.encode."""
+    
+    def test_encode_reference_value(self):
+        """Test encoding against the canonical reference geohash."""
+        assert encode(57.64911, 10.40744, precision=11) == "u4pruydqqvj"
+    
+    def test_encode_default_precision(self):
+        """Test that the default precision is six characters."""
+        geohash = encode(54.39641221825073, 18.62255276998812)
+        
+        assert geohash == "u3tjry"
+        assert encode(54.39641221825073, 18.62255276998812, precision=11).startswith(geohash)
+    
+    def test_encode_invalid_coordinates(self):
+        """Test that out-of-range coordinates are rejected."""
+        with pytest.raises(ValueError, match="Invalid coordinates"):
+            encode(91.0, 18.6)
@@ -5,11 +5,12 @@ Tests the MevoApiClient functionality including successful requests,
 error handling, and data parsing for the Gdańsk MEVO bike sharing system.
 """
 
+import re
+
 import pytest
-import pytest_asyncio
-from unittest.mock import AsyncMock, patch
 import httpx
 from datetime import datetime, timezone
+from tenacity import wait_none
 
 from app.services.mevo_api_client import (
     MevoApiClient,
@@ -20,265 +21,327 @@ from app.services.mevo_api_client import (
     create_mevo_client
 )
 
+SYSTEM_INFO_ROUTE = re.compile(r".*system_information.*")
+STATION_INFO_ROUTE = re.compile(r".*station_information.*")
+STATION_STATUS_ROUTE = re.compile(r".*station_status.*")
+
+INFO_PAYLOAD = {
+    "last_updated": 1757445615,
+    "ttl": 15,
+    "version": "2.3",
+    "data": {
+        "system_id": "inurba-gdansk",
+        "language": "pl",
+        "name": "MEVO",
+        "operator": "Inurba",
+        "timezone": "Europe/Warsaw",
+        "phone_number": "+48587391123",
+        "email": "kontakt@rowermevo.pl",
+        "rental_apps": {
+            "android": {
+                "discovery_uri": "rowermevo://",
+                "store_uri": "https://play.google.com/store/apps/details?id=com.urbansharing.citybike.gdansk"
+            },
+            "ios": {
+                "discovery_uri": "rowermevo://",
+                "store_uri": "https://apps.apple.com/pl/app/rowermevo/id6452801246"
+            }
+        }
+    }
+}
+
+STATION_PAYLOAD = {
+    "last_updated": 1757445615,
+    "ttl": 15,
+    "version": "2.3",
+    "data": {
+        "stations": [
+            {
+                "station_id": "5811",
+                "name": "GDA398",
+                "address": "Aleja Generała Józefa Hallera 201",
+                "cross_street": "Aleja Generała Józefa Hallera 201",
+                "lat": 54.39641221825073,
+                "lon": 18.62255276998812,
+                "is_virtual_station": True,
+                "capacity": 10,
+                "station_area": {
+                    "type": "MultiPolygon",
+                    "coordinates": [[[[18.62258501367978, 54.39645628596841]]]]
+                },
+                "rental_uris": {
+                    "android": "rowermevo://stations/5811",
+                    "ios": "rowermevo://stations/5811"
+                }
+            }
+        ]
+    }
+}
+
+STATUS_PAYLOAD = {
+    "last_updated": 1757445615,
+    "ttl": 15,
+    "version": "2.3",
+    "data": {
+        "stations": [
+            {
+                "station_id": "5811",
+                "num_bikes_available": 3,
+                "num_docks_available": 7,
+                "is_installed": True,
+                "is_renting": True,
+                "is_returning": True,
+                "last_reported": 1757445600
+            }
+        ]
+    }
+}
+
+# No GBFS ttl, so station lookups are not served from the response cache
+STATION_LOOKUP_PAYLOAD = {
+    "data": {
+        "stations": [
+            {
+                "station_id": "5811",
+                "name": "GDA398",
+                "address": "Test Address",
+                "cross_street": "Test Street",
+                "lat": 54.39641221825073,
+                "lon": 18.62255276998812,
+                "is_virtual_station": True,
+                "capacity": 10,
+                "rental_uris": {"android": "test://", "ios": "test://"}
+            }
+        ]
+    }
+}
+
+MALFORMED_STATUS_PAYLOAD = {
+    "data": {
+        "stations": [
+            {
+                "station_id": "5811",
+                "num_bikes_available": 3,
+                "num_docks_available": 7,
+                "is_installed": True,
+                "is_renting": True,
+                "is_returning": True,
+                "last_reported": 1757445600
+            },
+            {
+                "station_id": "5812",
+                "num_bikes_available": "not-a-number"
+            }
+        ]
+    }
+}
+
+# Valid JSON without the GBFS 'data' key
+INVALID_PAYLOAD = {"invalid": "structure"}
+
+
+@pytest.fixture
+def no_retry_wait(monkeypatch):
+    """Skip the backoff sleeps between request retries."""
+    monkeypatch.setattr(MevoApiClient._get_with_retry.retry, "wait", wait_none())
+
 
 class TestMevoApiClient:
     """Test cases for MevoApiClient."""
     
-    @pytest_asyncio.async_test
-    async def test_create_mevo_client(self):
+    def test_create_mevo_client(self):
         """Test client creation."""
-        client = await create_mevo_client()
+        client = create_mevo_client()
         assert isinstance(client, MevoApiClient)
     
-    @pytest_asyncio.async_test
+    @pytest.mark.asyncio
     async def test_context_manager(self):
         """Test async context manager functionality."""
         async with MevoApiClient() as client:
             assert client._session is not None
         # Session should be closed after exiting context
     
-    @pytest_asyncio.async_test
-    async def test_get_system_information_success(self):
+    @pytest.mark.asyncio
+    async def test_get_system_information_success(self, respx_mock):
         """Test successful system information retrieval."""
-        mock_response = {
-            "last_updated": 1757445615,
-            "ttl": 15,
-            "version": "2.3",
-            "data": {
-                "system_id": "inurba-gdansk",
-                "language": "pl",
-                "name": "MEVO",
-                "operator": "Inurba",
-                "timezone": "Europe/Warsaw",
-                "phone_number": "+48587391123",
-                "email": "kontakt@rowermevo.pl",
-                "rental_apps": {
-                    "android": {
-                        "discovery_uri": "rowermevo://",
-                        "store_uri": "https://play.google.com/store/apps/details?id=com.urbansharing.citybike.gdansk"
-                    },
-                    "ios": {
-                        "discovery_uri": "rowermevo://",
-                        "store_uri": "https://apps.apple.com/pl/app/rowermevo/id6452801246"
-                    }
-                }
-            }
-        }
+        respx_mock.get(SYSTEM_INFO_ROUTE).mock(
+            return_value=httpx.Response(200, json=INFO_PAYLOAD)
+        )
         
-        with patch('httpx.AsyncClient.get') as mock_get:
-            mock_response_obj = AsyncMock()
-            mock_response_obj.json.return_value = mock_response
-            mock_response_obj.raise_for_status.return_value = None
-            mock_get.return_value = mock_response_obj
+        async with MevoApiClient() as client:
+            system_info = await client.get_system_information()
             
-            async with MevoApiClient() as client:
-                system_info = await client.get_system_information()
-                
-                assert isinstance(system_info, MevoSystemInfo)
-                assert system_info.system_id == "inurba-gdansk"
-                assert system_info.name == "MEVO"
-                assert system_info.operator == "Inurba"
-                assert system_info.timezone == "Europe/Warsaw"
-                assert system_info.email == "kontakt@rowermevo.pl"
+            assert isinstance(system_info, MevoSystemInfo)
+            assert system_info.system_id == "inurba-gdansk"
+            assert system_info.name == "MEVO"
+            assert system_info.operator == "Inurba"
+            assert system_info.timezone == "Europe/Warsaw"
+            assert system_info.email == "kontakt@rowermevo.pl"
     
-    @pytest_asyncio.async_test
-    async def test_get_station_information_success(self):
+    @pytest.mark.asyncio
+    async def test_get_station_information_success(self, respx_mock):
         """Test successful station information retrieval."""
-        mock_response = {
-            "last_updated": 1757445615,
-            "ttl": 15,
-            "version": "2.3",
-            "data": {
-                "stations": [
-                    {
-                        "station_id": "5811",
-                        "name": "GDA398",
-                        "address": "Aleja Generała Józefa Hallera 201",
-                        "cross_street": "Aleja Generała Józefa Hallera 201",
-                        "lat": 54.39641221825073,
-                        "lon": 18.62255276998812,
-                        "is_virtual_station": True,
-                        "capacity": 10,
-                        "station_area": {
-                            "type": "MultiPolygon",
-                            "coordinates": [[[[18.62258501367978, 54.39645628596841]]]]
-                        },
-                        "rental_uris": {
-                            "android": "rowermevo://stations/5811",
-                            "ios": "rowermevo://stations/5811"
-                        }
-                    }
-                ]
-            }
-        }
+        respx_mock.get(STATION_INFO_ROUTE).mock(
+            return_value=httpx.Response(200, json=STATION_PAYLOAD)
+        )
         
-        with patch('httpx.AsyncClient.get') as mock_get:
-            mock_response_obj = AsyncMock()
-            mock_response_obj.json.return_value = mock_response
-            mock_response_obj.raise_for_status.return_value = None
-            mock_get.return_value = mock_response_obj
+        async with MevoApiClient() as client:
+            stations = await client.get_station_information()
             
-            async with MevoApiClient() as client:
-                stations = await client.get_station_information()
-                
-                assert len(stations) == 1
-                station = stations[0]
-                assert isinstance(station, MevoStation)
-                assert station.station_id == "5811"
-                assert station.name == "GDA398"
-                assert station.is_virtual_station is True
-                assert station.capacity == 10
-                assert station.lat == 54.39641221825073
-                assert station.lon == 18.62255276998812
+            assert len(stations) == 1
+            station = stations[0]
+            assert isinstance(station, MevoStation)
+            assert station.station_id == "5811"
+            assert station.name == "GDA398"
+            assert station.is_virtual_station is True
+            assert station.capacity == 10
+            assert station.lat == 54.39641221825073
+            assert station.lon == 18.62255276998812
     
-    @pytest_asyncio.async_test
-    async def test_get_station_status_success(self):
+    @pytest.mark.asyncio
+    async def test_get_station_status_success(self, respx_mock):
         """Test successful station status retrieval."""
-        mock_response = {
-            "last_updated": 1757445615,
-            "ttl": 15,
-            "version": "2.3",
-            "data": {
-                "stations": [
-                    {
-                        "station_id": "5811",
-                        "num_bikes_available": 3,
-                        "num_docks_available": 7,
-                        "is_installed": True,
-                        "is_renting": True,
-                        "is_returning": True,
-                        "last_reported": 1757445600
-                    }
-                ]
-            }
-        }
+        respx_mock.get(STATION_STATUS_ROUTE).mock(
+            return_value=httpx.Response(200, json=STATUS_PAYLOAD)
+        )
+        
+        async with MevoApiClient() as client:
+            statuses = await client.get_station_status()
+            
+            assert len(statuses) == 1
+            status = statuses[0]
+            assert isinstance(status, MevoStationStatus)
+            assert status.station_id == "5811"
+            assert status.num_bikes_available == 3
+            assert status.num_docks_available == 7
+            assert status.is_installed is True
+            assert status.is_renting is True
+            assert status.is_returning is True
+            assert status.last_reported == 1757445600
+    
+    @pytest.mark.asyncio
+    async def test_get_station_status_skips_malformed_entries(self, respx_mock):
+        """Test that one malformed status does not drop the whole feed."""
+        respx_mock.get(STATION_STATUS_ROUTE).mock(
+            return_value=httpx.Response(200, json=MALFORMED_STATUS_PAYLOAD)
+        )
         
-        with patch('httpx.AsyncClient.get') as mock_get:
-            mock_response_obj = AsyncMock()
-            mock_response_obj.json.return_value = mock_response
-            mock_response_obj.raise_for_status.return_value = None
-            mock_get.return_value = mock_response_obj
+        async with MevoApiClient() as client:
+            statuses = await client.get_station_status()
             
-            async with MevoApiClient() as client:
-                statuses = await client.get_station_status()
-                
-                assert len(statuses) == 1
-                status = statuses[0]
-                assert isinstance(status, MevoStationStatus)
-                assert status.station_id == "5811"
-                assert status.num_bikes_available == 3
-                assert status.num_docks_available == 7
-                assert status.is_installed is True
-                assert status.is_renting is True
-                assert status.is_returning is True
-                assert status.last_reported == 1757445600
+            assert len(statuses) == 1
+            assert statuses[0].station_id == "5811"
     
-    @pytest_asyncio.async_test
-    async def test_get_station_by_id_found(self):
+    @pytest.mark.asyncio
+    async def test_get_station_by_id_found(self, respx_mock):
         """Test finding a station by ID."""
-        mock_response = {
-            "data": {
-                "stations": [
-                    {
-                        "station_id": "5811",
-                        "name": "GDA398",
-                        "address": "Test Address",
-                        "cross_street": "Test Street",
-                        "lat": 54.39641221825073,
-                        "lon": 18.62255276998812,
-                        "is_virtual_station": True,
-                        "capacity": 10,
-                        "rental_uris": {"android": "test://", "ios": "test://"}
-                    }
-                ]
-            }
-        }
+        respx_mock.get(STATION_INFO_ROUTE).mock(
+            return_value=httpx.Response(200, json=STATION_LOOKUP_PAYLOAD)
+        )
         
-        with patch('httpx.AsyncClient.get') as mock_get:
-            mock_response_obj = AsyncMock()
-            mock_response_obj.json.return_value = mock_response
-            mock_response_obj.raise_for_status.return_value = None
-            mock_get.return_value = mock_response_obj
+        async with MevoApiClient() as client:
+            station = await client.get_station_by_id("5811")
             
-            async with MevoApiClient() as client:
-                station = await client.get_station_by_id("5811")
-                
-                assert station is not None
-                assert station.station_id == "5811"
-                assert station.name == "GDA398"
+            assert station is not None
+            assert station.station_id == "5811"
+            assert station.name == "GDA398"
     
-    @pytest_asyncio.async_test
-    async def test_get_station_by_id_not_found(self):
+    @pytest.mark.asyncio
+    async def test_get_station_by_id_not_found(self, respx_mock):
         """Test station not found by ID."""
-        mock_response = {
-            "data": {
-                "stations": [
-                    {
-                        "station_id": "5811",
-                        "name": "GDA398",
-                        "address": "Test Address",
-                        "cross_street": "Test Street",
-                        "lat": 54.39641221825073,
-                        "lon": 18.62255276998812,
-                        "is_virtual_station": True,
-                        "capacity": 10,
-                        "rental_uris": {"android": "test://", "ios": "test://"}
-                    }
-                ]
-            }
-        }
+        respx_mock.get(STATION_INFO_ROUTE).mock(
+            return_value=httpx.Response(200, json=STATION_LOOKUP_PAYLOAD)
+        )
         
-        with patch('httpx.AsyncClient.get') as mock_get:
-            mock_response_obj = AsyncMock()
-            mock_response_obj.json.return_value = mock_response
-            mock_response_obj.raise_for_status.return_value = None
-            mock_get.return_value = mock_response_obj
+        async with MevoApiClient() as client:
+            station = await client.get_station_by_id("nonexistent")
             
-            async with MevoApiClient() as client:
-                station = await client.get_station_by_id("nonexistent")
-                
-                assert station is None
+            assert station is None
     
-    @pytest_asyncio.async_test
-    async def test_http_error_handling(self):
-        """Test HTTP error handling."""
-        with patch('httpx.AsyncClient.get') as mock_get:
-            mock_response_obj = AsyncMock()
-            mock_response_obj.raise_for_status.side_effect = httpx.HTTPStatusError(
-                "404 Not Found", request=AsyncMock(), response=AsyncMock(status_code=404)
-            )
-            mock_get.return_value = mock_response_obj
+    @pytest.mark.asyncio
+    async def test_get_station_by_id_reuses_station_index(self, respx_mock):
+        """Test that repeated lookups fetch the station feed only once."""
+        route = respx_mock.get(STATION_INFO_ROUTE).mock(
+            return_value=httpx.Response(200, json=STATION_LOOKUP_PAYLOAD)
+        )
+        
+        async with MevoApiClient() as client:
+            first = await client.get_station_by_id("5811")
+            missing = await client.get_station_by_id("nonexistent")
+            second = await client.get_station_by_id("5811")
             
-            async with MevoApiClient() as client:
-                with pytest.raises(MevoApiError, match="HTTP 404 error from MEVO API"):
-                    await client.get_system_information()
+            assert first is not None
+            assert missing is None
+            assert second is first
+            assert route.call_count == 1
     
-    @pytest_asyncio.async_test
-    async def test_request_error_handling(self):
+    @pytest.mark.asyncio
+    async def test_make_request_caches_response_within_ttl(self, respx_mock):
+        """Test that a feed is not re-fetched within its GBFS ttl."""
+        route = respx_mock.get(STATION_INFO_ROUTE).mock(
+            return_value=httpx.Response(200, json=STATION_PAYLOAD)
+        )
+        
+        async with MevoApiClient() as client:
+            await client.get_station_information()
+            await client.get_station_information()
+            
+            assert route.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_http_error_handling(self, respx_mock):
+        """Test HTTP error handling."""
+        respx_mock.get(SYSTEM_INFO_ROUTE).mock(return_value=httpx.Response(404))
+        
+        async with MevoApiClient() as client:
+            with pytest.raises(MevoApiError, match="HTTP 404 error from MEVO API"):
+                await client.get_system_information()
+    
+    @pytest.mark.asyncio
+    async def test_request_error_handling(self, respx_mock, no_retry_wait):
         """Test network request error handling."""
-        with patch('httpx.AsyncClient.get') as mock_get:
-            mock_get.side_effect = httpx.RequestError("Connection failed")
+        respx_mock.get(SYSTEM_INFO_ROUTE).mock(side_effect=httpx.ConnectError("Connection failed"))
+        
+        async with MevoApiClient() as client:
+            with pytest.raises(MevoApiError, match="Network error connecting to MEVO API"):
+                await client.get_system_information()
+    
+    @pytest.mark.asyncio
+    async def test_server_error_is_retried(self, respx_mock, no_retry_wait):
+        """Test that a 5xx response is retried and a later success is returned."""
+        route = respx_mock.get(SYSTEM_INFO_ROUTE).mock(
+            side_effect=[httpx.Response(503), httpx.Response(200, json=INFO_PAYLOAD)]
+        )
+        
+        async with MevoApiClient() as client:
+            system_info = await client.get_system_information()
             
-            async with MevoApiClient() as client:
-                with pytest.raises(MevoApiError, match="Network error connecting to MEVO API"):
-                    await client.get_system_information()
+            assert system_info.system_id == "inurba-gdansk"
+            assert route.call_count == 2
     
-    @pytest_asyncio.async_test
-    async def test_invalid_gbfs_response(self):
-        """Test handling of invalid GBFS response structure."""
-        mock_response = {"invalid": "structure"}  # Missing 'data' key
+    @pytest.mark.asyncio
+    async def test_client_error_is_not_retried(self, respx_mock, no_retry_wait):
+        """Test that a 4xx response fails without retrying."""
+        route = respx_mock.get(SYSTEM_INFO_ROUTE).mock(return_value=httpx.Response(404))
         
-        with patch('httpx.AsyncClient.get') as mock_get:
-            mock_response_obj = AsyncMock()
-            mock_response_obj.json.return_value = mock_response
-            mock_response_obj.raise_for_status.return_value = None
-            mock_get.return_value = mock_response_obj
+        async with MevoApiClient() as client:
+            with pytest.raises(MevoApiError, match="HTTP 404 error from MEVO API"):
+                await client.get_system_information()
             
-            async with MevoApiClient() as client:
-                with pytest.raises(MevoApiError, match="Invalid GBFS response structure"):
-                    await client.get_system_information()
+            assert route.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_invalid_gbfs_response(self, respx_mock):
+        """Test handling of invalid GBFS response structure."""
+        respx_mock.get(SYSTEM_INFO_ROUTE).mock(
+            return_value=httpx.Response(200, json=INVALID_PAYLOAD)
+        )
+        
+        async with MevoApiClient() as client:
+            with pytest.raises(MevoApiError, match="Invalid GBFS response structure"):
+                await client.get_system_information()
     
-    @pytest_asyncio.async_test
+    @pytest.mark.asyncio
     async def test_session_not_initialized(self):
         """Test error when session is not initialized."""
         client = MevoApiClient()
@@ -286,71 +349,30 @@ class TestMevoApiClient:
         with pytest.raises(MevoApiError, match="Client session not initialized"):
             await client.get_system_information()
     
-    @pytest_asyncio.async_test
-    async def test_get_combined_station_data(self):
+    @pytest.mark.asyncio
+    async def test_get_combined_station_data(self, respx_mock):
         """Test combined station data retrieval."""
-        station_mock_response = {
-            "data": {
-                "stations": [
-                    {
-                        "station_id": "5811",
-                        "name": "GDA398",
-                        "address": "Test Address",
-                        "cross_street": "Test Street",
-                        "lat": 54.39641221825073,
-                        "lon": 18.62255276998812,
-                        "is_virtual_station": True,
-                        "capacity": 10,
-                        "rental_uris": {"android": "test://", "ios": "test://"}
-                    }
-                ]
-            }
-        }
-        
-        status_mock_response = {
-            "data": {
-                "stations": [
-                    {
-                        "station_id": "5811",
-                        "num_bikes_available": 3,
-                        "num_docks_available": 7,
-                        "is_installed": True,
-                        "is_renting": True,
-                        "is_returning": True,
-                        "last_reported": 1757445600
-                    }
-                ]
-            }
-        }
+        respx_mock.get(STATION_INFO_ROUTE).mock(
+            return_value=httpx.Response(200, json=STATION_PAYLOAD)
+        )
+        respx_mock.get(STATION_STATUS_ROUTE).mock(
+            return_value=httpx.Response(200, json=STATUS_PAYLOAD)
+        )
         
-        with patch('httpx.AsyncClient.get') as mock_get:
-            def side_effect(url):
-                mock_response_obj = AsyncMock()
-                mock_response_obj.raise_for_status.return_value = None
-                
-                if 'station_information' in url:
-                    mock_response_obj.json.return_value = station_mock_response
-                elif 'station_status' in url:
-                    mock_response_obj.json.return_value = status_mock_response
-                    
-                return mock_response_obj
+        async with MevoApiClient() as client:
+            combined_data = await client.get_combined_station_data()
+            
+            assert len(combined_data) == 1
+            station_data = combined_data[0]
             
-            mock_get.side_effect = side_effect
+            # Check station info fields
+            assert station_data['station_id'] == "5811"
+            assert station_data['name'] == "GDA398"
+            assert station_data['lat'] == 54.39641221825073
             
-            async with MevoApiClient() as client:
-                combined_data = await client.get_combined_station_data()
-                
-                assert len(combined_data) == 1
-                station_data = combined_data[0]
-                
-                # Check station info fields
-                assert station_data['station_id'] == "5811"
-                assert station_data['name'] == "GDA398"
-                assert station_data['lat'] == 54.39641221825073
-                
-                # Check status fields
-                assert station_data['num_bikes_available'] == 3
-                assert station_data['num_docks_available'] == 7
-                assert station_data['is_installed'] is True
-                assert station_data['last_reported'] == 1757445600
-                assert 'last_reported_datetime' in station_data
+            # Check status fields
+            assert station_data['num_bikes_available'] == 3
+            assert station_data['num_docks_available'] == 7
+            assert station_data['is_installed'] is True
+            assert station_data['last_reported'] == 1757445600
+            assert 'last_reported_datetime' in station_data
@@ -0,0 +1,86 @@
+"""
+Unit tests for the MEVO data seeder.
+
+Tests the seeder's database interactions against a mocked Supabase client
+and station repository.
+"""
+
+from collections import deque
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.core.config import settings
+from app.services.mevo_data_seeder import MevoDataSeeder
+
+AREA_COUNT_ROWS = [
+    {"area": "Gdańsk", "station_count": 3, "active_count": 2},
+    {"area": "Sopot", "station_count": 1, "active_count": 1},
+]
+
+SNAPSHOT_TIMESTAMP = datetime(2025, 9, 9, 19, 20, tzinfo=timezone.utc)
+
+
+def create_seeder() -> MevoDataSeeder:
+    """Create a seeder backed by a mocked Supabase client."""
+    db = Mock()
+    db.client = Mock()
+    return MevoDataSeeder(db=db, mevo_client=Mock())
+
+
+class TestMevoDataSeeder:
+    """Test cases for MevoDataSeeder."""
+    
+    @pytest.mark.asyncio
+    async def test_get_seeding_summary_uses_area_counts_rpc(self):
+        """Test that station counts come from the database aggregation."""
+        seeder = create_seeder()
+        seeder.db.client.rpc.return_value.execute.return_value = Mock(data=AREA_COUNT_ROWS)
+        seeder.repository.get_all_stations = AsyncMock()
+        seeder.repository.get_recent_sync_logs = AsyncMock(return_value=[])
+        
+        summary = await seeder.get_seeding_summary()
+        
+        seeder.db.client.rpc.assert_called_once_with('station_counts_by_area', {})
+        seeder.repository.get_all_stations.assert_not_awaited()
+        assert summary['total_stations'] == 4
+        assert summary['active_stations'] == 3
+        assert summary['inactive_stations'] == 1
+        assert summary['stations_by_area'] == {"Gdańsk": 3, "Sopot": 1}
+    
+    @pytest.mark.asyncio
+    async def test_process_statuses_counts_partially_written_snapshots(self, monkeypatch):
+        """Test that a failed snapshot chunk does not discard the chunks that were written."""
+        monkeypatch.setattr(settings, "snapshot_batch_size", 2)
+        seeder = create_seeder()
+        seeder.repository.supports_copy = AsyncMock(return_value=False)
+        
+        async def insert_chunk(rows):
+            if rows[0]['station_id'] == 3:
+                raise Exception("Database error: connection reset")
+            return len(rows)
+        
+        seeder.repository.create_availability_snapshots_raw = AsyncMock(side_effect=insert_chunk)
+        
+        statuses = [
+            Mock(
+                station_id=str(station_id),
+                num_bikes_available=1,
+                num_docks_available=9,
+                is_renting=True,
+                is_returning=True
+            )
+            for station_id in range(1, 7)
+        ]
+        station_lookup = {str(station_id): Mock(id=station_id) for station_id in range(1, 7)}
+        stats = {'stations_processed': 0, 'snapshots_created': 0, 'errors': deque()}
+        
+        await seeder._process_station_statuses_batch(
+            statuses, station_lookup, SNAPSHOT_TIMESTAMP, stats
+        )
+        
+        assert seeder.repository.create_availability_snapshots_raw.await_count == 3
+        assert stats['stations_processed'] == 6
+        assert stats['snapshots_created'] == 4
+        assert len(stats['errors']) == 1